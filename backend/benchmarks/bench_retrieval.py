@@ -0,0 +1,160 @@
+"""
+Compares flat and hierarchical (page-then-chunk) retrieval in ChatUseCase
+on synthetic corpora of increasing size.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_retrieval --sizes 2000 10000 40000
+
+Documents are ingested through IngestDocumentUseCase with fake parsing and
+embeddings, so page vectors are built exactly as in production. Chunks are
+clustered by document and page, as real text tends to be. The in-memory
+repository searches by brute force, so latencies reflect how many vectors each
+mode compares rather than Weaviate's HNSW performance; recall@k is the
+fraction of flat search's top-k that hierarchical search also returns.
+"""
+
+import argparse
+import asyncio
+import math
+import random
+import statistics
+import time
+from typing import Dict, List, Tuple
+from src.application.chat_use_case import ChatUseCase
+from src.application.ingest_use_case import IngestDocumentUseCase
+from src.domain.entities import Chunk, Document
+from src.domain.interfaces import DocumentParser, EmbeddingService
+from src.infrastructure.in_memory_repo import InMemoryVectorRepository
+
+DIMENSIONS = 48
+PAGES_PER_DOCUMENT = 20
+CHUNKS_PER_PAGE = 10
+
+
+def _normalize(vector: List[float]) -> List[float]:
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def _jitter(rng: random.Random, center: List[float], scale: float) -> List[float]:
+    return [c + rng.gauss(0, scale) for c in center]
+
+
+class SyntheticCorpus(DocumentParser, EmbeddingService):
+    """
+    Parses a document id into pages of one-line chunks and embeds each line
+    near its page's topic vector, which lies near its document's vector.
+    """
+
+    def __init__(self, seed: int = 7):
+        self.rng = random.Random(seed)
+        self.vectors: Dict[str, List[float]] = {}
+
+    async def parse(self, file_source: int) -> List[Document]:
+        document_center = [self.rng.gauss(0, 1) for _ in range(DIMENSIONS)]
+        documents = []
+        for page in range(1, PAGES_PER_DOCUMENT + 1):
+            page_center = _jitter(self.rng, document_center, 0.6)
+            lines = []
+            for line in range(CHUNKS_PER_PAGE):
+                text = f"d{file_source} p{page} l{line}"
+                self.vectors[text] = _jitter(self.rng, page_center, 1.0)
+                lines.append(text)
+            documents.append(
+                Document(content="\n\n".join(lines), metadata={"page_number": page})
+            )
+        return documents
+
+    async def embed_text(self, text: str) -> List[float]:
+        return self.vectors[text]
+
+    async def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return [self.vectors[text] for text in texts]
+
+
+async def _build(size: int) -> Tuple[InMemoryVectorRepository, SyntheticCorpus]:
+    store = InMemoryVectorRepository()
+    corpus = SyntheticCorpus()
+    ingest = IngestDocumentUseCase(
+        parser=corpus,
+        repo=store,
+        embedding_service=corpus,
+        # Every line becomes its own chunk
+        chunk_size=16,
+        chunk_overlap=0,
+        build_page_index=True,
+    )
+    documents = max(1, size // (PAGES_PER_DOCUMENT * CHUNKS_PER_PAGE))
+    for document in range(documents):
+        await ingest.execute(document, source_name=f"doc{document}.pdf")
+    return store, corpus
+
+
+async def _measure(
+    chat: ChatUseCase, store: InMemoryVectorRepository, queries: List[List[float]]
+) -> Tuple[List[List[Chunk]], float, float]:
+    results = []
+    latencies = []
+    store.compared = 0
+    for query in queries:
+        started = time.perf_counter()
+        results.append(await chat.retrieve(query))
+        latencies.append(time.perf_counter() - started)
+    return (
+        results,
+        statistics.mean(latencies) * 1000,
+        store.compared / len(queries),
+    )
+
+
+async def run(sizes: List[int], num_queries: int, page_limits: List[int]) -> None:
+    print(
+        f"{'chunks':>7} {'mode':>14} {'compared':>9} {'mean ms':>8} {'recall@5':>8}"
+    )
+    for size in sizes:
+        store, corpus = await _build(size)
+        rng = random.Random(size)
+        queries = [
+            _normalize(_jitter(rng, _normalize(chunk.embedding), 0.15))
+            for chunk in rng.sample(list(store.chunks.values()), num_queries)
+        ]
+
+        flat = ChatUseCase(repo=store, llm_service=None, embedding_service=corpus)
+        truth, flat_ms, flat_compared = await _measure(flat, store, queries)
+        print(
+            f"{len(store.chunks):>7} {'flat':>14} {flat_compared:>9.0f} "
+            f"{flat_ms:>8.2f} {1.0:>8.3f}"
+        )
+
+        for page_limit in page_limits:
+            hierarchical = ChatUseCase(
+                repo=store,
+                llm_service=None,
+                embedding_service=corpus,
+                retrieval_mode="hierarchical",
+                page_limit=page_limit,
+            )
+            found, ms, compared = await _measure(hierarchical, store, queries)
+            recall = statistics.mean(
+                len({c.id for c in f} & {c.id for c in t}) / len(t)
+                for f, t in zip(found, truth)
+            )
+            print(
+                f"{len(store.chunks):>7} {f'pages={page_limit}':>14} "
+                f"{compared:>9.0f} {ms:>8.2f} {recall:>8.3f}"
+            )
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[2_000, 10_000, 40_000]
+    )
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--page-limits", type=int, nargs="+", default=[5, 10, 20])
+    args = parser.parse_args(argv)
+    asyncio.run(run(args.sizes, args.queries, args.page_limits))
+
+
+if __name__ == "__main__":
+    main()
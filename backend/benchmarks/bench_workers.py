@@ -0,0 +1,167 @@
+"""
+Measures /api/chat throughput as the number of uvicorn workers grows,
+using the fake backends in `benchmarks.fake_app`.
+
+Usage (from the backend directory):
+    python -m benchmarks.bench_workers --max-workers 4 --shared-cache
+
+Each run starts `uvicorn --workers N`, drives it with a fixed number of
+concurrent clients asking a fixed pool of questions (so repeats hit the
+caches), and reports requests per second and latency percentiles.
+Workers are configured as in production by `src.workers`, so scaling is
+bounded both by the CPU cores available and by the upstream capacity
+that all workers share.
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import List, Tuple
+import httpx
+from src import workers as workers_module
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _worker_counts(max_workers: int) -> List[int]:
+    counts = []
+    n = 1
+    while n < max_workers:
+        counts.append(n)
+        n *= 2
+    counts.append(max_workers)
+    return counts
+
+
+async def _wait_until_ready(url: str, timeout: float = 30.0) -> None:
+    deadline = time.monotonic() + timeout
+    async with httpx.AsyncClient() as client:
+        while time.monotonic() < deadline:
+            try:
+                if (await client.get(url)).status_code == 200:
+                    return
+            except httpx.TransportError:
+                pass
+            await asyncio.sleep(0.2)
+    raise TimeoutError(f"Server at {url} did not start")
+
+
+async def _drive(
+    url: str, duration: float, concurrency: int, distinct_queries: int
+) -> Tuple[List[float], int]:
+    latencies: List[float] = []
+    errors = 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30.0) as client:
+
+        async def client_loop() -> None:
+            nonlocal errors
+            while time.monotonic() < deadline:
+                query = f"Question {random.randrange(distinct_queries)}?"
+                started = time.monotonic()
+                try:
+                    response = await client.post(
+                        f"{url}/api/chat", json={"query": query, "history": []}
+                    )
+                    response.raise_for_status()
+                except httpx.HTTPError:
+                    errors += 1
+                    continue
+                latencies.append(time.monotonic() - started)
+
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    return latencies, errors
+
+
+def _run(workers: int, args: argparse.Namespace, cache_path: str) -> dict:
+    env = {**os.environ, "WEB_CONCURRENCY": str(workers)}
+    if cache_path:
+        env["CACHE_PATH"] = cache_path
+
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "benchmarks.fake_app:app",
+            "--port",
+            str(args.port),
+            "--workers",
+            str(workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=BACKEND_DIR,
+        env=env,
+    )
+    url = f"http://127.0.0.1:{args.port}"
+    try:
+        asyncio.run(_wait_until_ready(url))
+        # Give the remaining workers time to finish their staggered start
+        time.sleep(workers_module.startup_stagger_seconds(workers) + 1.0)
+        latencies, errors = asyncio.run(
+            _drive(url, args.duration, args.concurrency, args.distinct_queries)
+        )
+    finally:
+        server.terminate()
+        server.wait()
+
+    latencies.sort()
+    return {
+        "workers": workers,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / args.duration,
+        "p50_ms": statistics.median(latencies) * 1000 if latencies else 0.0,
+        "p95_ms": latencies[int(len(latencies) * 0.95)] * 1000 if latencies else 0.0,
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--distinct-queries", type=int, default=500)
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument(
+        "--shared-cache",
+        action="store_true",
+        help="Share embedding and answer caches through SQLite (CACHE_PATH)",
+    )
+    args = parser.parse_args(argv)
+
+    print(
+        f"cpus={os.cpu_count()} duration={args.duration}s "
+        f"concurrency={args.concurrency} distinct_queries={args.distinct_queries} "
+        f"shared_cache={args.shared_cache}"
+    )
+    print(
+        f"{'workers':>7} {'requests':>9} {'errors':>6} {'req/s':>8} "
+        f"{'p50 ms':>7} {'p95 ms':>7} {'speedup':>7}"
+    )
+
+    baseline = None
+    for workers in _worker_counts(args.max_workers):
+        with tempfile.TemporaryDirectory() as tmp:
+            cache_path = os.path.join(tmp, "cache.db") if args.shared_cache else ""
+            result = _run(workers, args, cache_path)
+        baseline = baseline or result["rps"] or 1.0
+        print(
+            f"{result['workers']:>7} {result['requests']:>9} {result['errors']:>6} "
+            f"{result['rps']:>8.1f} {result['p50_ms']:>7.1f} {result['p95_ms']:>7.1f} "
+            f"{result['rps'] / baseline:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+The RAG Chatbot API wired to fake backends, for benchmarks that must not
+depend on Gemini or Weaviate. Mirrors `src.main` in how it builds the
+caches, sizes admission control per worker and staggers start-up, so
+CACHE_PATH, WEB_CONCURRENCY and STARTUP_STAGGER_SECONDS behave the same
+way. Upstream capacity is therefore shared by all workers, as in
+production, and bounds the throughput that more workers can add.
+"""
+
+import asyncio
+import hashlib
+import os
+import random
+from contextlib import asynccontextmanager
+from typing import List
+from fastapi import FastAPI
+from src import dependencies, workers
+from src.application.chat_use_case import ChatUseCase
+from src.domain.entities import ChatMessage, Chunk
+from src.domain.interfaces import EmbeddingService, LLMService
+from src.infrastructure.caches import InMemoryCache, SQLiteCache
+from src.infrastructure.cached_services import (
+    CachedEmbeddingService,
+    CachedLLMService,
+)
+from src.infrastructure.in_memory_repo import InMemoryVectorRepository
+from src.interfaces.api import router as api_router
+
+DIMENSIONS = 64
+CORPUS_SIZE = 500
+EMBED_LATENCY = float(os.getenv("FAKE_EMBED_LATENCY", "0.02"))
+LLM_LATENCY = float(os.getenv("FAKE_LLM_LATENCY", "0.1"))
+
+
+def _vector(text: str) -> List[float]:
+    rng = random.Random(hashlib.sha256(text.encode("utf-8")).digest())
+    return [rng.uniform(-1, 1) for _ in range(DIMENSIONS)]
+
+
+class FakeEmbeddingService(EmbeddingService):
+    async def embed_text(self, text: str) -> List[float]:
+        await asyncio.sleep(EMBED_LATENCY)
+        return _vector(text)
+
+    async def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        await asyncio.sleep(EMBED_LATENCY)
+        return [_vector(t) for t in texts]
+
+
+async def _seeded_repository() -> InMemoryVectorRepository:
+    """Brute-force search, standing in for the CPU cost of a real query."""
+    repo = InMemoryVectorRepository()
+    await repo.add_chunks(
+        [
+            Chunk(
+                text=f"Fact number {i}.",
+                embedding=_vector(str(i)),
+                metadata={"source": "fake.pdf", "page_number": i // 10 + 1},
+                id=str(i),
+            )
+            for i in range(CORPUS_SIZE)
+        ]
+    )
+    return repo
+
+
+class FakeLLMService(LLMService):
+    async def generate_response(
+        self, query: str, context: List[Chunk], history: List[ChatMessage]
+    ) -> str:
+        await asyncio.sleep(LLM_LATENCY)
+        return f"Answer to {query!r} from {len(context)} chunks."
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await workers.stagger_startup()
+
+    cache_path = os.getenv("CACHE_PATH")
+    cache = SQLiteCache(cache_path) if cache_path else InMemoryCache()
+
+    dependencies.chat_use_case = ChatUseCase(
+        repo=await _seeded_repository(),
+        llm_service=CachedLLMService(FakeLLMService(), cache),
+        embedding_service=CachedEmbeddingService(FakeEmbeddingService(), cache),
+    )
+    dependencies.admission_controller = workers.admission_controller()
+
+    yield
+
+    if isinstance(cache, SQLiteCache):
+        cache.close()
+
+
+app = FastAPI(title="RAG Chatbot API (fake backends)", lifespan=lifespan)
+app.include_router(api_router)
+
+
+@app.get("/")
+async def root():
+    return {"message": "RAG Chatbot API is running"}
@@ -0,0 +1,276 @@
+import asyncio
+import heapq
+import itertools
+import math
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+
+class AdmissionRejected(Exception):
+    """
+    Raised when a request cannot be admitted to its workload pool.
+
+    Attributes:
+        workload: The name of the pool that rejected the request.
+        reason: "queue_full" when the wait queue was already at capacity,
+            "timeout" when the request waited too long for a slot.
+        retry_after: Suggested number of seconds before retrying.
+    """
+
+    def __init__(self, workload: str, reason: str, retry_after: int):
+        super().__init__(f"{workload} workload rejected: {reason}")
+        self.workload = workload
+        self.reason = reason
+        self.retry_after = retry_after
+
+
+@dataclass
+class WorkloadPolicy:
+    """Limits applied to a single workload (e.g. chat or ingest)."""
+
+    max_concurrency: int
+    max_queue: int
+    timeout: float
+    priority: int  # Lower value wins when upstream capacity is scarce
+    # False for workloads that take upstream slots per call instead, via
+    # `AdmissionController.upstream_slot`, rather than one per admission
+    holds_upstream: bool = True
+
+
+class PrioritySemaphore:
+    """
+    A semaphore that hands freed slots to the waiter with the lowest
+    priority value first, falling back to FIFO order within a priority.
+    The last `reserved` slots are only handed to priority 0 waiters.
+    """
+
+    def __init__(self, value: int, reserved: int = 0):
+        self._value = value
+        self._reserved = reserved
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+
+    @property
+    def available(self) -> int:
+        return self._value
+
+    async def acquire(self, priority: int) -> None:
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        self._wake()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # The slot was granted just as we were cancelled; pass it on.
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self._value += 1
+        self._wake()
+
+    def _wake(self) -> None:
+        while self._waiters:
+            priority, _, future = self._waiters[0]
+            if future.done():
+                heapq.heappop(self._waiters)
+                continue
+            # Waiters are ordered by priority, so if the first one may not
+            # take a slot, none of the others may either
+            if self._value <= (self._reserved if priority > 0 else 0):
+                return
+            heapq.heappop(self._waiters)
+            self._value -= 1
+            future.set_result(None)
+
+
+class _WorkloadPool:
+    """Concurrency slots, bounded wait queue and metrics for one workload."""
+
+    def __init__(self, name: str, policy: WorkloadPolicy):
+        self.name = name
+        self.policy = policy
+        self.semaphore = asyncio.Semaphore(policy.max_concurrency)
+        self.active = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected_queue_full = 0
+        self.rejected_timeout = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def record_wait(self, seconds: float) -> None:
+        self.total_wait_seconds += seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, seconds)
+
+    def retry_after(self) -> int:
+        if self.admitted:
+            average_wait = self.total_wait_seconds / self.admitted
+            return max(1, math.ceil(max(average_wait, self.policy.timeout / 2)))
+        return max(1, math.ceil(self.policy.timeout))
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "active": self.active,
+            "queue_depth": self.waiting,
+            "max_concurrency": self.policy.max_concurrency,
+            "max_queue": self.policy.max_queue,
+            "admitted": self.admitted,
+            "rejected_queue_full": self.rejected_queue_full,
+            "rejected_timeout": self.rejected_timeout,
+            "avg_wait_seconds": (
+                self.total_wait_seconds / self.admitted if self.admitted else 0.0
+            ),
+            "max_wait_seconds": self.max_wait_seconds,
+        }
+
+
+class Admission:
+    """A granted admission. Call `release` exactly once when done."""
+
+    def __init__(self, controller: "AdmissionController", pool: _WorkloadPool):
+        self._controller = controller
+        self._pool = pool
+        self._released = False
+
+    def release(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        self._controller._release(self._pool)
+
+
+class AdmissionController:
+    """
+    Admission control for workloads sharing the event loop and upstream
+    services (Gemini quota, Weaviate client).
+
+    Each workload has its own concurrency pool and bounded wait queue.
+    On top of that, all workloads share a fixed amount of upstream
+    capacity which is handed out by priority, so interactive chat is
+    served before bulk ingestion when capacity is scarce. Part of that
+    capacity is reserved for priority 0, so long-running lower-priority
+    work can never hold all of it.
+    """
+
+    def __init__(
+        self,
+        policies: Optional[Dict[str, WorkloadPolicy]] = None,
+        upstream_capacity: int = 8,
+        reserved_upstream: int = 1,
+    ):
+        """
+        Args:
+            policies: Limits per workload; defaults to chat, ingest and batch.
+            upstream_capacity: Upstream calls allowed at once, all workloads
+                together.
+            reserved_upstream: Upstream slots only priority 0 workloads may
+                take. At least one slot is always left to the others.
+        """
+        if policies is None:
+            policies = {
+                "chat": WorkloadPolicy(
+                    max_concurrency=8, max_queue=64, timeout=10.0, priority=0
+                ),
+                "ingest": WorkloadPolicy(
+                    max_concurrency=2, max_queue=8, timeout=30.0, priority=1
+                ),
+                "batch": WorkloadPolicy(
+                    max_concurrency=1,
+                    max_queue=2,
+                    timeout=30.0,
+                    priority=2,
+                    holds_upstream=False,
+                ),
+            }
+        self.pools = {name: _WorkloadPool(name, p) for name, p in policies.items()}
+        self.upstream_capacity = upstream_capacity
+        self.reserved_upstream = max(0, min(reserved_upstream, upstream_capacity - 1))
+        self.upstream = PrioritySemaphore(upstream_capacity, self.reserved_upstream)
+
+    async def acquire(self, workload: str) -> Admission:
+        """
+        Waits for a slot in the given workload pool and for upstream capacity.
+
+        Raises:
+            KeyError: If the workload is unknown.
+            AdmissionRejected: If the queue is full or the wait times out.
+        """
+        pool = self.pools[workload]
+        policy = pool.policy
+
+        if pool.semaphore.locked() and pool.waiting >= policy.max_queue:
+            pool.rejected_queue_full += 1
+            raise AdmissionRejected(workload, "queue_full", pool.retry_after())
+
+        start = time.monotonic()
+        pool.waiting += 1
+        try:
+            await asyncio.wait_for(
+                self._acquire_slots(pool), timeout=policy.timeout
+            )
+        except asyncio.TimeoutError:
+            pool.rejected_timeout += 1
+            raise AdmissionRejected(workload, "timeout", pool.retry_after())
+        finally:
+            pool.waiting -= 1
+
+        pool.active += 1
+        pool.admitted += 1
+        pool.record_wait(time.monotonic() - start)
+        return Admission(self, pool)
+
+    @asynccontextmanager
+    async def admit(self, workload: str) -> AsyncIterator[None]:
+        """Context manager form of `acquire`."""
+        admission = await self.acquire(workload)
+        try:
+            yield
+        finally:
+            admission.release()
+
+    @asynccontextmanager
+    async def upstream_slot(self, workload: str) -> AsyncIterator[None]:
+        """
+        Holds one unit of upstream capacity at the workload's priority.
+        For admitted workloads that fan out into many upstream calls, such
+        as batch chat, so each call is accounted for individually.
+
+        Raises:
+            KeyError: If the workload is unknown.
+        """
+        await self.upstream.acquire(self.pools[workload].policy.priority)
+        try:
+            yield
+        finally:
+            self.upstream.release()
+
+    async def _acquire_slots(self, pool: _WorkloadPool) -> None:
+        await pool.semaphore.acquire()
+        if not pool.policy.holds_upstream:
+            return
+        try:
+            await self.upstream.acquire(pool.policy.priority)
+        except BaseException:
+            pool.semaphore.release()
+            raise
+
+    def _release(self, pool: _WorkloadPool) -> None:
+        pool.active -= 1
+        if pool.policy.holds_upstream:
+            self.upstream.release()
+        pool.semaphore.release()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Returns queue depths, wait times and rejection counts per workload."""
+        return {
+            "upstream": {
+                "capacity": self.upstream_capacity,
+                "reserved": self.reserved_upstream,
+                "available": self.upstream.available,
+            },
+            "workloads": {name: p.snapshot() for name, p in self.pools.items()},
+        }
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+from src.application.page_vector_pool import PageVectorPool
+from src.domain.interfaces import VectorStoreRepository
+
+
+@dataclass
+class BackfillReport:
+    chunks_scanned: int = 0
+    chunks_updated: int = 0
+    pages_written: int = 0
+
+
+class BackfillPageIndexUseCase:
+    """
+    Use case for building page vectors for chunks that were ingested
+    without them (e.g. before the page index existed), so hierarchical
+    retrieval can reach every document.
+    """
+
+    def __init__(self, repo: VectorStoreRepository, batch_size: int = 500):
+        self.repo = repo
+        self.batch_size = batch_size
+
+    async def execute(self) -> BackfillReport:
+        """
+        Executes the backfill: List pages -> Scan chunks -> Pool -> Store.
+        Pages that already have a vector are left alone, so it is safe to
+        run again.
+
+        Returns:
+            BackfillReport with the chunks scanned and updated and the page
+            vectors written.
+        """
+        report = BackfillReport()
+
+        # 1. Find the pages that already have vectors
+        indexed = {(p.source, p.page_number) for p in await self.repo.list_pages()}
+
+        pool = PageVectorPool()
+        async for chunks in self.repo.iter_chunks(batch_size=self.batch_size):
+            report.chunks_scanned += len(chunks)
+
+            # 2. Keep chunks whose page has no vector
+            missing = [
+                c
+                for c in chunks
+                if (c.metadata.get("source"), c.metadata.get("page_number"))
+                not in indexed
+            ]
+            if not missing:
+                continue
+
+            # 3. Store them again so the store can record page metadata
+            # added since they were ingested (e.g. Weaviate's page key)
+            await self.repo.add_chunks(missing)
+            report.chunks_updated += len(missing)
+            pool.add(missing)
+
+        # 4. Store the page vectors, reusing the chunk embeddings
+        pages = pool.summaries()
+        if pages:
+            await self.repo.add_page_summaries(pages)
+        report.pages_written = len(pages)
+        return report
@@ -0,0 +1,173 @@
+import asyncio
+import contextlib
+import time
+from dataclasses import dataclass, field
+from typing import (
+    AsyncContextManager,
+    AsyncIterator,
+    Iterable,
+    List,
+    Optional,
+    Set,
+)
+from src.application.admission_controller import AdmissionController
+from src.application.chat_use_case import ChatUseCase
+from src.domain.entities import ChatMessage, Citation
+
+
+@dataclass
+class BatchChatItem:
+    id: str
+    query: str
+    history: List[ChatMessage] = field(default_factory=list)
+
+
+@dataclass
+class BatchChatResult:
+    id: str
+    query: str
+    answer: Optional[str] = None
+    citations: List[Citation] = field(default_factory=list)
+    latency_ms: float = 0.0
+    error: Optional[str] = None
+
+
+class BatchChatUseCase:
+    """
+    Use case for answering many questions at once (evaluation sets,
+    offline Q&A).
+    """
+
+    def __init__(
+        self,
+        chat_use_case: ChatUseCase,
+        embed_batch_size: int = 100,
+        search_concurrency: int = 32,
+        generation_concurrency: int = 8,
+        max_pending: int = 400,
+        admission_controller: Optional[AdmissionController] = None,
+        workload: str = "batch",
+    ):
+        """
+        Args:
+            admission_controller: Optional controller whose upstream capacity
+                each retrieval and generation call takes a slot of, at the
+                priority of `workload`, so a running batch yields to chat.
+            workload: The admission workload the batch is accounted under.
+        """
+        self.chat_use_case = chat_use_case
+        self.embed_batch_size = embed_batch_size
+        self.search_concurrency = search_concurrency
+        self.generation_concurrency = generation_concurrency
+        self.max_pending = max(max_pending, embed_batch_size)
+        self.admission_controller = admission_controller
+        self.workload = workload
+
+    async def execute(
+        self, items: Iterable[BatchChatItem]
+    ) -> AsyncIterator[BatchChatResult]:
+        """
+        Executes the batch: Embed (batched) -> Retrieve (concurrent) ->
+        Generate (bounded parallelism).
+
+        Args:
+            items: The questions to answer.
+
+        Yields:
+            BatchChatResult for each item, in completion order.
+        """
+        results: asyncio.Queue = asyncio.Queue()
+        search_semaphore = asyncio.Semaphore(self.search_concurrency)
+        generation_semaphore = asyncio.Semaphore(self.generation_concurrency)
+        # Bounds how far embedding runs ahead of the consumer, so large
+        # files do not hold every query embedding, or every unread result,
+        # in memory at once. A slot is freed once its result is consumed.
+        pending = asyncio.Semaphore(self.max_pending)
+        tasks: Set[asyncio.Task] = set()
+        done = object()
+        embedding_service = self.chat_use_case.embedding_service
+
+        async def process(
+            item: BatchChatItem, embedding: List[float], started: float
+        ) -> None:
+            result = BatchChatResult(id=item.id, query=item.query)
+            try:
+                async with search_semaphore, self._upstream_slot():
+                    chunks = await self.chat_use_case.retrieve(embedding)
+                async with generation_semaphore, self._upstream_slot():
+                    response = await self.chat_use_case.answer(
+                        item.query, item.history, chunks
+                    )
+                result.answer = response.answer
+                result.citations = response.citations
+            except Exception as e:
+                result.error = str(e)
+            result.latency_ms = (time.monotonic() - started) * 1000
+            await results.put(result)
+
+        async def produce() -> None:
+            try:
+                for batch in self._batched(items):
+                    for _ in batch:
+                        await pending.acquire()
+                    started = time.monotonic()
+                    try:
+                        async with self._upstream_slot():
+                            embeddings = await embedding_service.embed_queries(
+                                [item.query for item in batch]
+                            )
+                        if len(embeddings) != len(batch):
+                            raise ValueError(
+                                f"expected {len(batch)} embeddings, "
+                                f"got {len(embeddings)}"
+                            )
+                    except Exception as e:
+                        latency_ms = (time.monotonic() - started) * 1000
+                        for item in batch:
+                            await results.put(
+                                BatchChatResult(
+                                    id=item.id,
+                                    query=item.query,
+                                    latency_ms=latency_ms,
+                                    error=f"Embedding failed: {e}",
+                                )
+                            )
+                        continue
+
+                    for item, embedding in zip(batch, embeddings):
+                        task = asyncio.create_task(process(item, embedding, started))
+                        tasks.add(task)
+                        task.add_done_callback(tasks.discard)
+                await asyncio.gather(*tasks)
+            finally:
+                await results.put(done)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                result = await results.get()
+                if result is done:
+                    break
+                yield result
+                pending.release()
+            # Surface unexpected producer failures (e.g. a bad input iterator)
+            await producer
+        finally:
+            # The consumer may stop early, e.g. when a client disconnects
+            for task in [producer, *tasks]:
+                task.cancel()
+
+    def _upstream_slot(self) -> AsyncContextManager[None]:
+        if self.admission_controller is None:
+            return contextlib.nullcontext()
+        return self.admission_controller.upstream_slot(self.workload)
+
+    def _batched(self, items: Iterable[BatchChatItem]) -> Iterable[List[BatchChatItem]]:
+        batch: List[BatchChatItem] = []
+        for item in items:
+            batch.append(item)
+            if len(batch) == self.embed_batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
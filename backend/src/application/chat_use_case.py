@@ -24,10 +24,24 @@ class ChatUseCase:
         repo: VectorStoreRepository,
         llm_service: LLMService,
         embedding_service: EmbeddingService,
+        retrieval_mode: str = "flat",
+        page_limit: int = 10,
     ):
+        """
+        Args:
+            retrieval_mode: "flat" searches all chunks; "hierarchical" first
+                finds the `page_limit` most relevant pages, then searches
+                only their chunks. Chunks on pages without a page vector
+                are not found; see BackfillPageIndexUseCase.
+        """
+        if retrieval_mode not in ("flat", "hierarchical"):
+            raise ValueError("retrieval_mode must be 'flat' or 'hierarchical'")
+
         self.repo = repo
         self.llm_service = llm_service
         self.embedding_service = embedding_service
+        self.retrieval_mode = retrieval_mode
+        self.page_limit = page_limit
 
     async def execute(
         self, query: str, history: List[ChatMessage]
@@ -46,15 +60,33 @@ class ChatUseCase:
         query_embedding = await self.embedding_service.embed_text(query)
 
         # 2. Retrieve relevant chunks
-        relevant_chunks = await self.repo.search(query_embedding, limit=5)
+        relevant_chunks = await self.retrieve(query_embedding)
 
-        # 3. Generate answer
-        answer = await self.llm_service.generate_response(
-            query, relevant_chunks, history
-        )
+        # 3. Generate answer with citations
+        return await self.answer(query, history, relevant_chunks)
 
-        # 4. Extract citations
-        citations = self._extract_citations(relevant_chunks)
+    async def retrieve(self, query_embedding: List[float]) -> List[Chunk]:
+        """
+        Retrieves the chunks most relevant to an already embedded query.
+        """
+        if self.retrieval_mode == "hierarchical":
+            pages = await self.repo.search_pages(
+                query_embedding, limit=self.page_limit
+            )
+            # Fall back to flat search when no page index has been built
+            if pages:
+                return await self.repo.search(query_embedding, limit=5, pages=pages)
+
+        return await self.repo.search(query_embedding, limit=5)
+
+    async def answer(
+        self, query: str, history: List[ChatMessage], chunks: List[Chunk]
+    ) -> ChatResponse:
+        """
+        Generates an answer from retrieved chunks and extracts its citations.
+        """
+        answer = await self.llm_service.generate_response(query, chunks, history)
+        citations = self._extract_citations(chunks)
 
         return ChatResponse(answer=answer, citations=citations)
 
@@ -1,13 +1,27 @@
-from typing import Any, List
+import asyncio
+import uuid
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Set
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from src.application.page_vector_pool import PageVectorPool
 from src.domain.entities import Chunk
 from src.domain.interfaces import (
     DocumentParser,
     VectorStoreRepository,
     EmbeddingService,
+    NearDuplicateIndex,
 )
 
 
+@dataclass
+class IngestReport:
+    chunks_total: int = 0
+    chunks_stored: int = 0
+    duplicates_skipped: int = 0
+    duplicates_linked: int = 0
+    embeddings_saved: int = 0
+
+
 class IngestDocumentUseCase:
     """
     Use case for ingesting documents into the system.
@@ -20,48 +34,223 @@ class IngestDocumentUseCase:
         embedding_service: EmbeddingService,
         chunk_size: int = 1000,
         chunk_overlap: int = 200,
+        duplicate_index: Optional[NearDuplicateIndex] = None,
+        duplicate_mode: str = "skip",
+        build_page_index: bool = False,
     ):
+        """
+        Args:
+            duplicate_index: Optional index used to detect chunks that nearly
+                duplicate previously ingested ones.
+            duplicate_mode: "skip" drops duplicates entirely; "link" stores
+                them with the canonical chunk's embedding and a
+                `canonical_id`, so their own citations still work, at the
+                cost of one more object and vector in the store each.
+            build_page_index: Also store one vector per page, the mean of its
+                chunk embeddings, for coarse-to-fine retrieval.
+        """
+        if duplicate_mode not in ("skip", "link"):
+            raise ValueError("duplicate_mode must be 'skip' or 'link'")
+
         self.parser = parser
         self.repo = repo
         self.embedding_service = embedding_service
         self.text_splitter = RecursiveCharacterTextSplitter(
             chunk_size=chunk_size, chunk_overlap=chunk_overlap
         )
+        self.duplicate_index = duplicate_index
+        self.duplicate_mode = duplicate_mode
+        self.build_page_index = build_page_index
+        # Chunks indexed as canonical whose ingest has not finished storing
+        # them yet; shared by concurrent calls to `execute`
+        self._in_flight_ids: Set[str] = set()
 
-    async def execute(self, file_source: Any, source_name: str = "unknown") -> None:
+    async def execute(
+        self, file_source: Any, source_name: str = "unknown"
+    ) -> IngestReport:
         """
-        Executes the ingestion process: Parse -> Chunk -> Embed -> Store.
+        Executes the ingestion process: Parse -> Chunk -> Deduplicate ->
+        Embed -> Store.
 
         Args:
             file_source: The file content or path to be parsed.
             source_name: The name of the source (e.g., filename).
+
+        Returns:
+            IngestReport with chunk counts and the embeddings saved by
+            near-duplicate detection.
         """
+        report = IngestReport()
+        indexed_ids: List[str] = []
+
+        try:
+            chunks_to_store = await self._prepare_chunks(
+                file_source, source_name, report, indexed_ids
+            )
+
+            # 6. Store in Vector DB
+            if chunks_to_store:
+                await self.repo.add_chunks(chunks_to_store)
+        except Exception:
+            # Chunks that were never stored must not become canonical
+            if self.duplicate_index is not None:
+                self.duplicate_index.remove(indexed_ids)
+            raise
+        finally:
+            self._in_flight_ids.difference_update(indexed_ids)
+
+        if self.duplicate_index is not None:
+            await asyncio.to_thread(self.duplicate_index.persist)
+
+        # 7. Store page-level vectors; mean pooling needs no extra API calls.
+        # Pages that already have a vector, e.g. from an earlier ingest of
+        # the same source, are extended rather than replaced.
+        if self.build_page_index and chunks_to_store:
+            pool = PageVectorPool()
+            pool.add(chunks_to_store)
+            pool.add_summaries(await self.repo.get_page_summaries(pool.summaries()))
+            await self.repo.add_page_summaries(pool.summaries())
+
+        report.chunks_stored = len(chunks_to_store)
+        return report
+
+    async def _prepare_chunks(
+        self,
+        file_source: Any,
+        source_name: str,
+        report: IngestReport,
+        indexed_ids: List[str],
+    ) -> List[Chunk]:
         # 1. Parse the document
         documents = await self.parser.parse(file_source)
 
         chunks_to_store: List[Chunk] = []
+        linked_chunks: List[Chunk] = []
+        embeddings_by_id: Dict[str, List[float]] = {}
 
         for doc in documents:
             # 2. Chunk the content
             # We use langchain's splitter which works on text
             split_texts = self.text_splitter.split_text(doc.content)
+            report.chunks_total += len(split_texts)
 
-            # 3. Generate embeddings
-            embeddings = await self.embedding_service.embed_documents(split_texts)
-
-            # 4. Create Chunk entities
-            for i, text in enumerate(split_texts):
-                chunk = Chunk(
+            # 3. Create Chunk entities, setting near-duplicates aside
+            chunks = [
+                Chunk(
                     text=text,
-                    embedding=embeddings[i],
                     metadata={
                         **doc.metadata,
                         "source": source_name,
                         "chunk_index": i,
                     },
+                    id=str(uuid.uuid4()),
+                )
+                for i, text in enumerate(split_texts)
+            ]
+            canonical_ids: List[Optional[str]] = [None] * len(chunks)
+            if self.duplicate_index is not None and chunks:
+                # MinHash is CPU-bound, so keep it off the event loop
+                canonical_ids = await asyncio.to_thread(self._find_or_index, chunks)
+
+            new_chunks: List[Chunk] = []
+            for chunk, canonical_id in zip(chunks, canonical_ids):
+                if canonical_id is None:
+                    if self.duplicate_index is not None:
+                        indexed_ids.append(chunk.id)
+                    new_chunks.append(chunk)
+                elif self.duplicate_mode == "link":
+                    chunk.metadata["canonical_id"] = canonical_id
+                    linked_chunks.append(chunk)
+                else:
+                    report.duplicates_skipped += 1
+                    report.embeddings_saved += 1
+
+            # 4. Generate embeddings
+            if new_chunks:
+                embeddings = await self.embedding_service.embed_documents(
+                    [c.text for c in new_chunks]
                 )
-                chunks_to_store.append(chunk)
+                for chunk, embedding in zip(new_chunks, embeddings):
+                    chunk.embedding = embedding
+                    embeddings_by_id[chunk.id] = embedding
+                chunks_to_store.extend(new_chunks)
+
+        # 5. Reuse canonical embeddings for linked duplicates
+        if linked_chunks:
+            await self._resolve_linked_chunks(
+                linked_chunks, embeddings_by_id, report, indexed_ids
+            )
+            chunks_to_store.extend(linked_chunks)
+
+        return chunks_to_store
+
+    def _find_or_index(self, chunks: List[Chunk]) -> List[Optional[str]]:
+        """
+        Returns each chunk's canonical id, indexing chunks that have none.
+        Runs in a worker thread.
+        """
+        canonical_ids = []
+        for chunk in chunks:
+            # Mark the chunk in flight before it becomes visible in the index
+            self._in_flight_ids.add(chunk.id)
+            canonical_id = self.duplicate_index.find_or_add(chunk.id, chunk.text)
+            if canonical_id is not None:
+                self._in_flight_ids.discard(chunk.id)
+            canonical_ids.append(canonical_id)
+        return canonical_ids
+
+    async def _resolve_linked_chunks(
+        self,
+        chunks: List[Chunk],
+        embeddings_by_id: Dict[str, List[float]],
+        report: IngestReport,
+        indexed_ids: List[str],
+    ) -> None:
+        """
+        Gives each linked duplicate its canonical chunk's embedding. Chunks
+        whose canonical is not stored are embedded themselves. If the
+        canonical is stale, i.e. not still being stored by a concurrent
+        ingest, they also replace it in the index.
+        """
+        missing = {
+            c.metadata["canonical_id"]
+            for c in chunks
+            if c.metadata["canonical_id"] not in embeddings_by_id
+        }
+        if missing:
+            embeddings_by_id.update(await self.repo.get_embeddings(list(missing)))
+
+        orphans: List[Chunk] = []
+        for chunk in chunks:
+            embedding = embeddings_by_id.get(chunk.metadata["canonical_id"])
+            if embedding is None:
+                orphans.append(chunk)
+                continue
+            chunk.embedding = embedding
+            report.duplicates_linked += 1
+            report.embeddings_saved += 1
+
+        if not orphans:
+            return
+
+        replacements = [
+            c for c in orphans if c.metadata["canonical_id"] not in self._in_flight_ids
+        ]
+        stale_ids = {c.metadata["canonical_id"] for c in replacements}
+        self.duplicate_index.remove(list(stale_ids))
+        for chunk in orphans:
+            del chunk.metadata["canonical_id"]
+
+        embeddings = await self.embedding_service.embed_documents(
+            [c.text for c in orphans]
+        )
+        for chunk, embedding in zip(orphans, embeddings):
+            chunk.embedding = embedding
 
-        # 5. Store in Vector DB
-        if chunks_to_store:
-            await self.repo.add_chunks(chunks_to_store)
+        if replacements:
+            canonical_ids = await asyncio.to_thread(self._find_or_index, replacements)
+            indexed_ids.extend(
+                chunk.id
+                for chunk, canonical_id in zip(replacements, canonical_ids)
+                if canonical_id is None
+            )
@@ -0,0 +1,55 @@
+from typing import Dict, Iterable, List, Tuple
+from src.domain.entities import Chunk, PageSummary
+
+
+class PageVectorPool:
+    """
+    Mean-pools chunk embeddings into one vector per (source, page). Chunks
+    can be added in several calls, e.g. while scanning a whole collection,
+    and stored page vectors can be merged in to extend them.
+    """
+
+    def __init__(self):
+        self._sums: Dict[Tuple[str, int], List[float]] = {}
+        self._counts: Dict[Tuple[str, int], int] = {}
+
+    def add(self, chunks: Iterable[Chunk]) -> None:
+        for chunk in chunks:
+            if chunk.embedding is None:
+                continue
+            key = (
+                chunk.metadata.get("source", "unknown"),
+                chunk.metadata.get("page_number", 0),
+            )
+            self._add(key, chunk.embedding, 1)
+
+    def add_summaries(self, pages: Iterable[PageSummary]) -> None:
+        """Merges in page vectors, weighted by the chunks they were pooled from."""
+        for page in pages:
+            if page.embedding is None or page.chunk_count <= 0:
+                continue
+            total = [value * page.chunk_count for value in page.embedding]
+            self._add((page.source, page.page_number), total, page.chunk_count)
+
+    def summaries(self) -> List[PageSummary]:
+        pages = []
+        for (source, page_number), total in self._sums.items():
+            count = self._counts[(source, page_number)]
+            pages.append(
+                PageSummary(
+                    source=source,
+                    page_number=page_number,
+                    embedding=[value / count for value in total],
+                    chunk_count=count,
+                )
+            )
+        return pages
+
+    def _add(self, key: Tuple[str, int], total: List[float], count: int) -> None:
+        current = self._sums.get(key)
+        if current is None:
+            self._sums[key] = list(total)
+            self._counts[key] = count
+        else:
+            self._sums[key] = [a + b for a, b in zip(current, total)]
+            self._counts[key] += count
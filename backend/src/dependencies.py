@@ -1,9 +1,13 @@
 from src.application.ingest_use_case import IngestDocumentUseCase
 from src.application.chat_use_case import ChatUseCase
+from src.application.batch_chat_use_case import BatchChatUseCase
+from src.application.admission_controller import AdmissionController
 
 # Global variables for dependencies
 ingest_use_case: IngestDocumentUseCase = None
 chat_use_case: ChatUseCase = None
+batch_chat_use_case: BatchChatUseCase = None
+admission_controller: AdmissionController = None
 
 
 def get_ingest_use_case() -> IngestDocumentUseCase:
@@ -16,3 +20,15 @@ def get_chat_use_case() -> ChatUseCase:
     if not chat_use_case:
         raise RuntimeError("Chat use case not initialized")
     return chat_use_case
+
+
+def get_batch_chat_use_case() -> BatchChatUseCase:
+    if not batch_chat_use_case:
+        raise RuntimeError("Batch chat use case not initialized")
+    return batch_chat_use_case
+
+
+def get_admission_controller() -> AdmissionController:
+    if not admission_controller:
+        raise RuntimeError("Admission controller not initialized")
+    return admission_controller
@@ -17,6 +17,17 @@ class Chunk:
     text: str
     embedding: Optional[List[float]] = None
     metadata: Dict[str, Any] = field(default_factory=dict)
+    id: Optional[str] = None
+
+
+@dataclass
+class PageSummary:
+    """Represents a page-level vector: the mean of its chunks' embeddings."""
+
+    source: str
+    page_number: int
+    embedding: Optional[List[float]] = None
+    chunk_count: int = 0
 
 
 @dataclass
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import List, Any
-from src.domain.entities import Document, Chunk, ChatMessage
+from typing import List, Any, AsyncIterator, Dict, Optional
+from src.domain.entities import Document, Chunk, ChatMessage, PageSummary
 
 
 class VectorStoreRepository(ABC):
@@ -8,12 +8,60 @@ class VectorStoreRepository(ABC):
 
     @abstractmethod
     async def add_chunks(self, chunks: List[Chunk]) -> None:
-        """Adds chunks to the vector store."""
+        """Adds chunks to the vector store, replacing any with the same id."""
         pass
 
     @abstractmethod
-    async def search(self, query_vector: List[float], limit: int = 5) -> List[Chunk]:
-        """Searches for relevant chunks based on a query vector."""
+    async def search(
+        self,
+        query_vector: List[float],
+        limit: int = 5,
+        pages: Optional[List[PageSummary]] = None,
+    ) -> List[Chunk]:
+        """
+        Searches for relevant chunks based on a query vector, optionally
+        only within the given pages.
+        """
+        pass
+
+    @abstractmethod
+    async def add_page_summaries(self, pages: List[PageSummary]) -> None:
+        """Adds or replaces page-level vectors in the vector store."""
+        pass
+
+    @abstractmethod
+    async def search_pages(
+        self, query_vector: List[float], limit: int = 10
+    ) -> List[PageSummary]:
+        """Searches for relevant pages based on a query vector."""
+        pass
+
+    @abstractmethod
+    async def get_embeddings(self, chunk_ids: List[str]) -> Dict[str, List[float]]:
+        """
+        Returns the stored embeddings of the given chunks, keyed by chunk id.
+        Unknown ids are omitted.
+        """
+        pass
+
+    @abstractmethod
+    async def get_page_summaries(
+        self, pages: List[PageSummary]
+    ) -> List[PageSummary]:
+        """
+        Returns the stored versions of the given pages, with their
+        embeddings and chunk counts. Unknown pages are omitted.
+        """
+        pass
+
+    @abstractmethod
+    def iter_chunks(self, batch_size: int = 500) -> AsyncIterator[List[Chunk]]:
+        """Yields every stored chunk, with its embedding, in batches."""
+        pass
+
+    @abstractmethod
+    async def list_pages(self) -> List[PageSummary]:
+        """Returns every stored page, without its embedding."""
         pass
 
 
@@ -51,3 +99,66 @@ class EmbeddingService(ABC):
     async def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Generates embeddings for a list of text strings."""
         pass
+
+    async def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generates query embeddings for a list of text strings in one batch.
+        Defaults to `embed_documents`; override when queries are embedded
+        differently from documents.
+        """
+        return await self.embed_documents(texts)
+
+
+class NearDuplicateIndex(ABC):
+    """Interface for detecting near-duplicate chunk text."""
+
+    @abstractmethod
+    def find_duplicate(self, text: str) -> Optional[str]:
+        """Returns the id of an indexed chunk that nearly duplicates the text."""
+        pass
+
+    @abstractmethod
+    def add(self, chunk_id: str, text: str) -> None:
+        """Indexes a chunk's text as a canonical candidate for later lookups."""
+        pass
+
+    @abstractmethod
+    def find_or_add(self, chunk_id: str, text: str) -> Optional[str]:
+        """
+        Returns the id of an indexed near-duplicate of the text, or indexes
+        the chunk as canonical and returns None if there is none.
+        """
+        pass
+
+    @abstractmethod
+    def remove(self, chunk_ids: List[str]) -> None:
+        """Removes chunks from the index, e.g. when storing them failed."""
+        pass
+
+    @abstractmethod
+    def persist(self) -> None:
+        """Persists changes made since the last call, if backed by storage."""
+        pass
+
+
+class KeyValueCache(ABC):
+    """Interface for caching serialized values by key."""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached value, or None on a miss."""
+        pass
+
+    @abstractmethod
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        """Returns the cached values of the keys that are present."""
+        pass
+
+    @abstractmethod
+    async def set_many(self, items: Dict[str, bytes]) -> None:
+        """Stores several values at once."""
+        pass
+
+    async def set(self, key: str, value: bytes) -> None:
+        """Stores a single value."""
+        await self.set_many({key: value})
@@ -0,0 +1,140 @@
+import hashlib
+import json
+from array import array
+from typing import Awaitable, Callable, Dict, List
+from src.domain.interfaces import EmbeddingService, KeyValueCache, LLMService
+from src.domain.entities import Chunk, ChatMessage
+
+
+# Embeddings are stored as float32, which halves their size and matches
+# the precision the embedding model returns
+_VECTOR_FORMAT = "f"
+
+
+def _pack_vector(vector: List[float]) -> bytes:
+    return array(_VECTOR_FORMAT, vector).tobytes()
+
+
+def _unpack_vector(data: bytes) -> List[float]:
+    vector = array(_VECTOR_FORMAT)
+    vector.frombytes(data)
+    return vector.tolist()
+
+
+class CachedEmbeddingService(EmbeddingService):
+    """
+    EmbeddingService decorator that serves repeated queries from a cache
+    and only sends cache misses to the wrapped service. Document embeddings
+    are passed through: each chunk is embedded once at ingestion and
+    stored in the vector store, so caching them would only evict queries.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService,
+        cache: KeyValueCache,
+        namespace: str = "embedding",
+    ):
+        """
+        Args:
+            embedding_service: The service that computes embeddings.
+            cache: Where embeddings are stored.
+            namespace: Key prefix; change it when the embedding model changes.
+        """
+        self.embedding_service = embedding_service
+        self.cache = cache
+        self.namespace = namespace
+
+    async def embed_text(self, text: str) -> List[float]:
+        """Generates an embedding for a single text string."""
+        key = self._key("query", text)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return _unpack_vector(cached)
+
+        embedding = await self.embedding_service.embed_text(text)
+        await self.cache.set(key, _pack_vector(embedding))
+        return embedding
+
+    async def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        """Generates embeddings for a list of text strings."""
+        return await self.embedding_service.embed_documents(texts)
+
+    async def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Generates query embeddings for a list of text strings in one batch."""
+        return await self._embed_many(
+            "query", texts, self.embedding_service.embed_queries
+        )
+
+    async def _embed_many(
+        self,
+        kind: str,
+        texts: List[str],
+        embed: Callable[[List[str]], Awaitable[List[List[float]]]],
+    ) -> List[List[float]]:
+        keys = {text: self._key(kind, text) for text in texts}
+        cached = await self.cache.get_many(list(set(keys.values())))
+        embeddings: Dict[str, List[float]] = {
+            text: _unpack_vector(cached[key])
+            for text, key in keys.items()
+            if key in cached
+        }
+
+        missing = [text for text in keys if text not in embeddings]
+        if missing:
+            computed = await embed(missing)
+            embeddings.update(zip(missing, computed))
+            await self.cache.set_many(
+                {keys[text]: _pack_vector(e) for text, e in zip(missing, computed)}
+            )
+
+        return [embeddings[text] for text in texts]
+
+    def _key(self, kind: str, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.namespace}:{kind}:{_VECTOR_FORMAT}:{digest}"
+
+
+class CachedLLMService(LLMService):
+    """
+    LLMService decorator that caches answers by query, retrieved context and
+    history, so the same question over the same chunks is answered once.
+    """
+
+    def __init__(
+        self,
+        llm_service: LLMService,
+        cache: KeyValueCache,
+        namespace: str = "answer",
+    ):
+        self.llm_service = llm_service
+        self.cache = cache
+        self.namespace = namespace
+
+    async def generate_response(
+        self, query: str, context: List[Chunk], history: List[ChatMessage]
+    ) -> str:
+        """
+        Generates a response from the LLM based on query, context, and history.
+        """
+        key = self._key(query, context, history)
+        cached = await self.cache.get(key)
+        if cached is not None:
+            return cached.decode("utf-8")
+
+        answer = await self.llm_service.generate_response(query, context, history)
+        await self.cache.set(key, answer.encode("utf-8"))
+        return answer
+
+    def _key(
+        self, query: str, context: List[Chunk], history: List[ChatMessage]
+    ) -> str:
+        payload = json.dumps(
+            {
+                "query": query,
+                "context": [c.text for c in context],
+                "history": [[m.role, m.content] for m in history],
+            }
+        )
+        digest = hashlib.sha256(payload.encode("utf-8")).hexdigest()
+        return f"{self.namespace}:{digest}"
@@ -0,0 +1,178 @@
+import asyncio
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+from src.domain.interfaces import KeyValueCache
+
+# Stay well below SQLite's limit on bound parameters per statement
+_SQL_BATCH_SIZE = 500
+
+_MiB = 1024 * 1024
+
+
+class InMemoryCache(KeyValueCache):
+    """
+    Implementation of KeyValueCache as an in-process LRU dictionary,
+    bounded by the bytes held in keys and values. Suitable for a single
+    worker process.
+    """
+
+    def __init__(self, max_bytes: int = 64 * _MiB):
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+
+    async def get(self, key: str) -> Optional[bytes]:
+        value = self._entries.get(key)
+        if value is not None:
+            self._entries.move_to_end(key)
+        return value
+
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        found = {}
+        for key in keys:
+            value = await self.get(key)
+            if value is not None:
+                found[key] = value
+        return found
+
+    async def set_many(self, items: Dict[str, bytes]) -> None:
+        for key, value in items.items():
+            old = self._entries.get(key)
+            if old is not None:
+                self._size -= len(key) + len(old)
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._size += len(key) + len(value)
+        while self._size > self.max_bytes and self._entries:
+            key, value = self._entries.popitem(last=False)
+            self._size -= len(key) + len(value)
+
+
+class SQLiteCache(KeyValueCache):
+    """
+    Implementation of KeyValueCache backed by a SQLite database in WAL mode,
+    so that several worker processes can share one on-disk cache. Readers
+    never block writers; writers serialize on SQLite's file lock.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * _MiB,
+        prune_interval: int = 1_000,
+        busy_timeout: float = 5.0,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            path: Database file, shared by all workers.
+            max_bytes: Oldest entries are pruned once keys and values
+                together take more than this many bytes.
+            prune_interval: Number of writes by this process between prunes.
+            busy_timeout: Seconds to wait for another process's write lock.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.prune_interval = prune_interval
+        self.busy_timeout = busy_timeout
+        self._local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
+        self._writes_since_prune = 0
+
+        conn = self._connection()
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value BLOB NOT NULL, created_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "CREATE INDEX IF NOT EXISTS cache_created_at ON cache (created_at)"
+        )
+
+    async def get(self, key: str) -> Optional[bytes]:
+        found = await self.get_many([key])
+        return found.get(key)
+
+    async def get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        if not keys:
+            return {}
+        return await asyncio.to_thread(self._get_many, keys)
+
+    async def set_many(self, items: Dict[str, bytes]) -> None:
+        if items:
+            await asyncio.to_thread(self._set_many, items)
+
+    def close(self) -> None:
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections = []
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads, and
+        # `asyncio.to_thread` may run each call on a different one
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.path,
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _get_many(self, keys: List[str]) -> Dict[str, bytes]:
+        conn = self._connection()
+        found = {}
+        for start in range(0, len(keys), _SQL_BATCH_SIZE):
+            batch = keys[start : start + _SQL_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT key, value FROM cache WHERE key IN ({placeholders})", batch
+            )
+            found.update((key, bytes(value)) for key, value in rows)
+        return found
+
+    def _set_many(self, items: Dict[str, bytes]) -> None:
+        conn = self._connection()
+        now = time.time()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.executemany(
+                "INSERT OR REPLACE INTO cache (key, value, created_at) "
+                "VALUES (?, ?, ?)",
+                [(key, value, now) for key, value in items.items()],
+            )
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        self._writes_since_prune += len(items)
+        if self._writes_since_prune >= self.prune_interval:
+            self._writes_since_prune = 0
+            self._prune(conn)
+
+    def _prune(self, conn: sqlite3.Connection) -> None:
+        (size,) = conn.execute(
+            "SELECT COALESCE(SUM(length(key) + length(value)), 0) FROM cache"
+        ).fetchone()
+        if size > self.max_bytes:
+            # Keep the newest entries that fit, delete the rest
+            conn.execute(
+                "DELETE FROM cache WHERE rowid IN ("
+                "SELECT rowid FROM (SELECT rowid, SUM(length(key) + length(value)) "
+                "OVER (ORDER BY created_at DESC, rowid DESC) AS total FROM cache) "
+                "WHERE total > ?)",
+                (self.max_bytes,),
+            )
@@ -102,3 +102,9 @@ class GeminiEmbeddingService(EmbeddingService):
     async def embed_documents(self, texts: List[str]) -> List[List[float]]:
         """Generates embeddings for a list of text strings."""
         return await self.embeddings.aembed_documents(texts)
+
+    async def embed_queries(self, texts: List[str]) -> List[List[float]]:
+        """Generates query embeddings for a list of text strings in one batch."""
+        return await self.embeddings.aembed_documents(
+            texts, task_type="RETRIEVAL_QUERY"
+        )
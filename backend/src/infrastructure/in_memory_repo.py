@@ -0,0 +1,118 @@
+import math
+import operator
+import uuid
+from typing import AsyncIterator, Dict, List, Optional, Tuple
+from src.domain.interfaces import VectorStoreRepository
+from src.domain.entities import Chunk, PageSummary
+
+
+def _norm(vector: List[float]) -> float:
+    return math.sqrt(sum(v * v for v in vector)) or 1.0
+
+
+def _page_of(chunk: Chunk) -> Tuple[str, int]:
+    return (
+        chunk.metadata.get("source", "unknown"),
+        chunk.metadata.get("page_number", 0),
+    )
+
+
+class InMemoryVectorRepository(VectorStoreRepository):
+    """
+    Implementation of VectorStoreRepository that keeps chunks and pages in
+    dictionaries and ranks them by cosine similarity with a brute-force
+    scan. Used by tests and benchmarks in place of Weaviate.
+    """
+
+    def __init__(self):
+        self.chunks: Dict[str, Chunk] = {}
+        self.chunks_by_page: Dict[Tuple[str, int], Dict[str, Chunk]] = {}
+        self.pages: Dict[Tuple[str, int], PageSummary] = {}
+        # Vectors scored by searches, for measuring how much a filter saves
+        self.compared = 0
+        self._norms: Dict[str, float] = {}
+        self._page_norms: Dict[Tuple[str, int], float] = {}
+
+    async def add_chunks(self, chunks: List[Chunk]) -> None:
+        for chunk in chunks:
+            if chunk.id is None:
+                chunk.id = str(uuid.uuid4())
+            old = self.chunks.get(chunk.id)
+            if old is not None:
+                self.chunks_by_page[_page_of(old)].pop(chunk.id, None)
+            self.chunks[chunk.id] = chunk
+            self.chunks_by_page.setdefault(_page_of(chunk), {})[chunk.id] = chunk
+            self._norms[chunk.id] = _norm(chunk.embedding)
+
+    async def search(
+        self,
+        query_vector: List[float],
+        limit: int = 5,
+        pages: Optional[List[PageSummary]] = None,
+    ) -> List[Chunk]:
+        if pages:
+            candidates = [
+                chunk
+                for page in pages
+                for chunk in self.chunks_by_page.get(
+                    (page.source, page.page_number), {}
+                ).values()
+            ]
+        else:
+            candidates = list(self.chunks.values())
+        self.compared += len(candidates)
+
+        # The query norm is the same for every candidate, so it is left out
+        def score(chunk: Chunk) -> float:
+            dot = sum(map(operator.mul, query_vector, chunk.embedding))
+            return dot / self._norms[chunk.id]
+
+        return sorted(candidates, key=score, reverse=True)[:limit]
+
+    async def get_embeddings(self, chunk_ids: List[str]) -> Dict[str, List[float]]:
+        return {
+            chunk_id: self.chunks[chunk_id].embedding
+            for chunk_id in chunk_ids
+            if chunk_id in self.chunks
+        }
+
+    async def get_page_summaries(
+        self, pages: List[PageSummary]
+    ) -> List[PageSummary]:
+        keys = {(p.source, p.page_number) for p in pages}
+        return [self.pages[key] for key in keys if key in self.pages]
+
+    async def iter_chunks(self, batch_size: int = 500) -> AsyncIterator[List[Chunk]]:
+        chunks = list(self.chunks.values())
+        for start in range(0, len(chunks), batch_size):
+            yield chunks[start : start + batch_size]
+
+    async def add_page_summaries(self, pages: List[PageSummary]) -> None:
+        for page in pages:
+            if page.embedding is None:
+                continue
+            key = (page.source, page.page_number)
+            self.pages[key] = page
+            self._page_norms[key] = _norm(page.embedding)
+
+    async def search_pages(
+        self, query_vector: List[float], limit: int = 10
+    ) -> List[PageSummary]:
+        self.compared += len(self.pages)
+
+        def score(item: Tuple[Tuple[str, int], PageSummary]) -> float:
+            key, page = item
+            dot = sum(map(operator.mul, query_vector, page.embedding))
+            return dot / self._page_norms[key]
+
+        ranked = sorted(self.pages.items(), key=score, reverse=True)[:limit]
+        return [
+            PageSummary(page.source, page.page_number, chunk_count=page.chunk_count)
+            for _, page in ranked
+        ]
+
+    async def list_pages(self) -> List[PageSummary]:
+        return [
+            PageSummary(page.source, page.page_number, chunk_count=page.chunk_count)
+            for page in self.pages.values()
+        ]
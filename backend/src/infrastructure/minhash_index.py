@@ -0,0 +1,236 @@
+import json
+import os
+import random
+import re
+import threading
+import zlib
+from collections import defaultdict
+from typing import Dict, List, Optional, Set, Tuple
+from src.domain.interfaces import NearDuplicateIndex
+
+# Mersenne prime used for the universal hash family (a * x + b) mod p
+_PRIME = (1 << 61) - 1
+_MAX_HASH = (1 << 32) - 1
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+
+class MinHashLSHIndex(NearDuplicateIndex):
+    """
+    Implementation of NearDuplicateIndex using MinHash signatures over word
+    shingles, bucketed with banded locality-sensitive hashing.
+
+    Candidates that share a band are confirmed by comparing the estimated
+    Jaccard similarity of their signatures against `threshold`. Methods are
+    thread-safe, so lookups can run off the event loop with
+    `asyncio.to_thread` while several ingests are in progress.
+    """
+
+    def __init__(
+        self,
+        threshold: float = 0.8,
+        num_perm: int = 128,
+        bands: int = 16,
+        shingle_size: int = 3,
+        path: Optional[str] = None,
+        seed: int = 1,
+        compact_min_entries: int = 10_000,
+    ):
+        """
+        Initialize the index.
+
+        Args:
+            threshold: Minimum estimated Jaccard similarity for a duplicate.
+            num_perm: Number of hash permutations per signature.
+            bands: Number of LSH bands; must divide num_perm.
+            shingle_size: Number of consecutive words per shingle.
+            path: Optional JSONL file the index is loaded from and appended
+                to on `persist`, so it survives restarts. Only one process
+                may write to a given path.
+            seed: Seed for the hash permutations. Must stay the same for a
+                persisted index.
+            compact_min_entries: The log is rewritten as a snapshot of the
+                live chunks once it has more than this many entries and more
+                than twice as many entries as live chunks.
+        """
+        if num_perm % bands:
+            raise ValueError("bands must divide num_perm")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+        self.path = path
+        self.compact_min_entries = compact_min_entries
+
+        rng = random.Random(seed)
+        self._permutations = [
+            (rng.randrange(1, _PRIME), rng.randrange(0, _PRIME))
+            for _ in range(num_perm)
+        ]
+        self._signatures: Dict[str, Tuple[int, ...]] = {}
+        self._buckets: List[Dict[Tuple[int, ...], Set[str]]] = [
+            defaultdict(set) for _ in range(bands)
+        ]
+        self._pending: List[dict] = []
+        self._lock = threading.Lock()
+        # Lines in the file at `path`, and whether it must be rewritten
+        # before anything is appended (e.g. it ends with a torn line)
+        self._log_entries = 0
+        self._needs_compaction = False
+
+        if path and os.path.exists(path):
+            self._load(path)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def find_duplicate(self, text: str) -> Optional[str]:
+        signature = self._signature(text)
+        if signature is None:
+            return None
+        with self._lock:
+            return self._find(signature)
+
+    def add(self, chunk_id: str, text: str) -> None:
+        signature = self._signature(text)
+        if signature is None:
+            return
+        with self._lock:
+            self._add(chunk_id, signature)
+
+    def find_or_add(self, chunk_id: str, text: str) -> Optional[str]:
+        # Hashing is the expensive part, so it is done once and outside
+        # the lock; the lookup and insert happen atomically under it
+        signature = self._signature(text)
+        if signature is None:
+            return None
+        with self._lock:
+            duplicate_id = self._find(signature)
+            if duplicate_id is None:
+                self._add(chunk_id, signature)
+            return duplicate_id
+
+    def remove(self, chunk_ids: List[str]) -> None:
+        with self._lock:
+            for chunk_id in chunk_ids:
+                if self._delete(chunk_id):
+                    self._pending.append({"op": "remove", "id": chunk_id})
+
+    def persist(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+            if not self.path:
+                return
+            log_entries = self._log_entries + len(pending)
+            if self._needs_compaction or (
+                log_entries > self.compact_min_entries
+                and log_entries > 2 * len(self._signatures)
+            ):
+                self._compact()
+            elif pending:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.write("".join(json.dumps(entry) + "\n" for entry in pending))
+                self._log_entries = log_entries
+
+    def _compact(self) -> None:
+        """
+        Replaces the log with one `add` entry per live chunk. The snapshot is
+        written to a temporary file first, so a crash leaves either the old
+        or the new log in place.
+        """
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            for chunk_id, signature in self._signatures.items():
+                entry = {"op": "add", "id": chunk_id, "sig": signature}
+                f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, self.path)
+        self._log_entries = len(self._signatures)
+        self._needs_compaction = False
+
+    def _find(self, signature: Tuple[int, ...]) -> Optional[str]:
+        candidates: Set[str] = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best_id = None
+        best_similarity = self.threshold
+        for chunk_id in candidates:
+            similarity = self._similarity(signature, self._signatures[chunk_id])
+            if similarity >= best_similarity:
+                best_id, best_similarity = chunk_id, similarity
+        return best_id
+
+    def _add(self, chunk_id: str, signature: Tuple[int, ...]) -> None:
+        self._insert(chunk_id, signature)
+        self._pending.append({"op": "add", "id": chunk_id, "sig": signature})
+
+    def _signature(self, text: str) -> Optional[Tuple[int, ...]]:
+        tokens = _TOKEN_PATTERN.findall(text.lower())
+        if not tokens:
+            return None
+        size = min(self.shingle_size, len(tokens))
+        hashes = {
+            zlib.crc32(" ".join(tokens[i : i + size]).encode("utf-8"))
+            for i in range(len(tokens) - size + 1)
+        }
+        return tuple(
+            min(((a * h + b) % _PRIME) & _MAX_HASH for h in hashes)
+            for a, b in self._permutations
+        )
+
+    def _band_keys(self, signature: Tuple[int, ...]) -> List[Tuple[int, ...]]:
+        return [
+            signature[band * self.rows : (band + 1) * self.rows]
+            for band in range(self.bands)
+        ]
+
+    @staticmethod
+    def _similarity(left: Tuple[int, ...], right: Tuple[int, ...]) -> float:
+        matches = sum(1 for a, b in zip(left, right) if a == b)
+        return matches / len(left)
+
+    def _insert(self, chunk_id: str, signature: Tuple[int, ...]) -> None:
+        self._signatures[chunk_id] = signature
+        for band, key in enumerate(self._band_keys(signature)):
+            self._buckets[band][key].add(chunk_id)
+
+    def _delete(self, chunk_id: str) -> bool:
+        signature = self._signatures.pop(chunk_id, None)
+        if signature is None:
+            return False
+        for band, key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(key)
+            if bucket is not None:
+                bucket.discard(chunk_id)
+                if not bucket:
+                    del self._buckets[band][key]
+        return True
+
+    def _load(self, path: str) -> None:
+        invalid = 0
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if not line.strip():
+                    continue
+                self._log_entries += 1
+                if not line.endswith("\n"):
+                    # Torn by a crash during `persist`; appending to it
+                    # would corrupt the next entry too
+                    self._needs_compaction = True
+                try:
+                    entry = json.loads(line)
+                    if entry["op"] == "add":
+                        signature = tuple(entry["sig"])
+                        if len(signature) == self.num_perm:
+                            self._insert(entry["id"], signature)
+                    elif entry["op"] == "remove":
+                        self._delete(entry["id"])
+                except (ValueError, KeyError, TypeError):
+                    invalid += 1
+
+        if invalid:
+            print(f"Skipped {invalid} invalid entries in duplicate index {path}")
+            self._needs_compaction = True
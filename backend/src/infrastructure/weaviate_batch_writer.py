@@ -0,0 +1,166 @@
+import asyncio
+import json
+import uuid
+from dataclasses import dataclass, field, replace
+from typing import Dict, List
+from weaviate.classes.data import DataObject
+
+
+@dataclass
+class ObjectWriteError:
+    """An object that could not be written after all retries."""
+
+    index: int  # Position in the list passed to `write`
+    uuid: str
+    message: str
+
+
+@dataclass
+class BatchWriteResult:
+    inserted: int = 0
+    errors: List[ObjectWriteError] = field(default_factory=list)
+
+
+class BatchWriteError(Exception):
+    """Raised when some objects could not be written to the vector store."""
+
+    def __init__(self, errors: List[ObjectWriteError]):
+        first = errors[0].message if errors else ""
+        super().__init__(
+            f"Failed to write {len(errors)} objects (first error: {first})"
+        )
+        self.errors = errors
+
+
+class WeaviateBatchWriter:
+    """
+    Writes objects to a Weaviate collection in size-limited batches,
+    keeping several `insert_many` calls in flight over gRPC and retrying
+    only the objects that failed.
+    """
+
+    def __init__(
+        self,
+        collection,
+        max_batch_objects: int = 200,
+        max_batch_bytes: int = 4 * 1024 * 1024,
+        max_in_flight: int = 4,
+        max_retries: int = 3,
+        retry_backoff: float = 0.5,
+    ):
+        """
+        Args:
+            collection: An async Weaviate collection handle.
+            max_batch_objects: Maximum number of objects per request.
+            max_batch_bytes: Approximate maximum payload size per request.
+            max_in_flight: Number of batches sent concurrently.
+            max_retries: Retries for failed objects before giving up.
+            retry_backoff: Base delay in seconds, doubled after each retry.
+        """
+        self.collection = collection
+        self.max_batch_objects = max_batch_objects
+        self.max_batch_bytes = max_batch_bytes
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        self.retry_backoff = retry_backoff
+
+    async def write(self, objects: List[DataObject]) -> BatchWriteResult:
+        """
+        Writes all objects, returning the number inserted and the
+        per-object errors of those that still failed after retries.
+        """
+        # Fix UUIDs up front so a retried object overwrites, rather than
+        # duplicates, any copy that reached the server before a failure
+        objects = [
+            obj if obj.uuid is not None else replace(obj, uuid=uuid.uuid4())
+            for obj in objects
+        ]
+
+        semaphore = asyncio.Semaphore(self.max_in_flight)
+
+        async def write_bounded(batch: Dict[int, DataObject]) -> BatchWriteResult:
+            async with semaphore:
+                return await self._write_batch(batch)
+
+        batch_results = await asyncio.gather(
+            *(write_bounded(batch) for batch in self._split(objects))
+        )
+
+        result = BatchWriteResult()
+        for batch_result in batch_results:
+            result.inserted += batch_result.inserted
+            result.errors.extend(batch_result.errors)
+        result.errors.sort(key=lambda e: e.index)
+        return result
+
+    def _split(self, objects: List[DataObject]) -> List[Dict[int, DataObject]]:
+        """Splits objects into batches bounded by count and estimated size."""
+        batches: List[Dict[int, DataObject]] = []
+        batch: Dict[int, DataObject] = {}
+        batch_bytes = 0
+
+        for index, obj in enumerate(objects):
+            size = self._estimate_size(obj)
+            if batch and (
+                len(batch) >= self.max_batch_objects
+                or batch_bytes + size > self.max_batch_bytes
+            ):
+                batches.append(batch)
+                batch = {}
+                batch_bytes = 0
+            batch[index] = obj
+            batch_bytes += size
+
+        if batch:
+            batches.append(batch)
+        return batches
+
+    @staticmethod
+    def _estimate_size(obj: DataObject) -> int:
+        # Vectors travel over gRPC as packed 32-bit floats
+        vector_bytes = 4 * len(obj.vector) if obj.vector is not None else 0
+        return len(json.dumps(obj.properties, default=str)) + vector_bytes
+
+    async def _write_batch(self, batch: Dict[int, DataObject]) -> BatchWriteResult:
+        """
+        Inserts one batch, retrying only the objects that failed.
+
+        Args:
+            batch: Objects keyed by their index in the original write.
+        """
+        result = BatchWriteResult()
+        pending = batch
+        messages: Dict[int, str] = {}
+
+        for attempt in range(self.max_retries + 1):
+            if attempt:
+                await asyncio.sleep(self.retry_backoff * 2 ** (attempt - 1))
+
+            indices = list(pending)
+            try:
+                response = await self.collection.data.insert_many(
+                    [pending[i] for i in indices]
+                )
+            except Exception as e:
+                # The whole request failed; every object in it is retried
+                messages = {i: str(e) for i in indices}
+                continue
+
+            messages = {
+                indices[position]: error.message
+                for position, error in response.errors.items()
+            }
+            result.inserted += len(indices) - len(messages)
+            pending = {i: pending[i] for i in messages}
+            if not pending:
+                break
+
+        for index in sorted(pending):
+            result.errors.append(
+                ObjectWriteError(
+                    index=index,
+                    uuid=str(pending[index].uuid),
+                    message=messages[index],
+                )
+            )
+        return result
@@ -1,58 +1,187 @@
+import asyncio
 import weaviate
 import weaviate.classes.config as wvc
 import weaviate.classes.query as wvq
 from weaviate.classes.data import DataObject
-from typing import List
+from weaviate.util import generate_uuid5
+from typing import AsyncIterator, Dict, List, Optional
 from src.domain.interfaces import VectorStoreRepository
-from src.domain.entities import Chunk
+from src.domain.entities import Chunk, PageSummary
+from src.infrastructure.weaviate_batch_writer import (
+    WeaviateBatchWriter,
+    BatchWriteError,
+)
+
+
+def _page_key(source: str, page_number: int) -> str:
+    """Identifies a page; also used as the id of its Page object."""
+    return str(generate_uuid5(f"{source}#{page_number}"))
+
+
+# Matched exactly, unlike `source`, whose word tokenization would let a
+# filter on "a.pdf" also match e.g. "a b.pdf"
+_PAGE_KEY_PROPERTY = wvc.Property(
+    name="page_key",
+    data_type=wvc.DataType.TEXT,
+    tokenization=wvc.Tokenization.FIELD,
+)
+
+_CHUNK_PROPERTIES = [
+    wvc.Property(name="text", data_type=wvc.DataType.TEXT),
+    wvc.Property(name="source", data_type=wvc.DataType.TEXT),
+    wvc.Property(name="page_number", data_type=wvc.DataType.INT),
+    wvc.Property(name="canonical_id", data_type=wvc.DataType.TEXT),
+    _PAGE_KEY_PROPERTY,
+]
+
+_PAGE_PROPERTIES = [
+    wvc.Property(name="source", data_type=wvc.DataType.TEXT),
+    wvc.Property(name="page_number", data_type=wvc.DataType.INT),
+    wvc.Property(name="chunk_count", data_type=wvc.DataType.INT),
+    _PAGE_KEY_PROPERTY,
+]
 
 
 class WeaviateRepository(VectorStoreRepository):
-    def __init__(self, client: weaviate.WeaviateAsyncClient):
+    def __init__(
+        self,
+        client: weaviate.WeaviateAsyncClient,
+        max_batch_objects: int = 200,
+        max_in_flight: int = 4,
+        max_retries: int = 3,
+    ):
         self.client = client
         self.collection_name = "Chunk"
+        self.page_collection_name = "Page"
+        self._properties = {
+            self.collection_name: _CHUNK_PROPERTIES,
+            self.page_collection_name: _PAGE_PROPERTIES,
+        }
+        self.max_batch_objects = max_batch_objects
+        self.max_in_flight = max_in_flight
+        self.max_retries = max_retries
+        # Cached once a collection is known to exist, so that searches
+        # and inserts do not pay for an existence check on every call
+        self._collections = {}
+        self._collection_lock = asyncio.Lock()
 
     async def _ensure_collection(self):
-        exists = await self.client.collections.exists(self.collection_name)
-        if not exists:
-            await self.client.collections.create(
-                name=self.collection_name,
-                vectorizer_config=wvc.Configure.Vectorizer.none(),
-                properties=[
-                    wvc.Property(name="text", data_type=wvc.DataType.TEXT),
-                    wvc.Property(name="source", data_type=wvc.DataType.TEXT),
-                    wvc.Property(name="page_number", data_type=wvc.DataType.INT),
-                ],
-            )
+        return await self._get_or_create(self.collection_name)
+
+    async def _ensure_page_collection(self):
+        return await self._get_or_create(self.page_collection_name)
+
+    async def _get_or_create(self, name: str):
+        if name in self._collections:
+            return self._collections[name]
+
+        async with self._collection_lock:
+            if name not in self._collections:
+                exists = await self.client.collections.exists(name)
+                if not exists:
+                    await self.client.collections.create(
+                        name=name,
+                        vectorizer_config=wvc.Configure.Vectorizer.none(),
+                        properties=self._properties[name],
+                    )
+                await self._open(name, add_missing_properties=exists)
+        return self._collections[name]
+
+    async def _open(self, name: str, add_missing_properties: bool) -> None:
+        """Caches the handle of a collection known to exist."""
+        collection = self.client.collections.get(name)
+        if add_missing_properties:
+            await self._add_missing_properties(collection, self._properties[name])
+        self._collections[name] = collection
+
+    async def _add_missing_properties(
+        self, collection, properties: List[wvc.Property]
+    ) -> None:
+        """
+        Adds properties introduced after the collection was created, so they
+        get their configured tokenization rather than auto-schema defaults
+        on first insert.
+        """
+        config = await collection.config.get()
+        existing = {prop.name for prop in config.properties}
+        for prop in properties:
+            if prop.name not in existing:
+                await collection.config.add_property(prop)
+
+    async def _get_existing(self, name: str):
+        """
+        Returns the collection, or None if it has not been created yet (e.g.
+        nothing ingested). A miss is not cached so the collection is picked
+        up once it exists.
+        """
+        if name in self._collections:
+            return self._collections[name]
+        if not await self.client.collections.exists(name):
+            return None
+
+        # Cached handles are also used for writes, so bring the schema up
+        # to date as `_get_or_create` would
+        async with self._collection_lock:
+            if name not in self._collections:
+                await self._open(name, add_missing_properties=True)
+        return self._collections[name]
+
+    async def _write(self, collection, data_objects: List[DataObject]) -> None:
+        writer = WeaviateBatchWriter(
+            collection,
+            max_batch_objects=self.max_batch_objects,
+            max_in_flight=self.max_in_flight,
+            max_retries=self.max_retries,
+        )
+        result = await writer.write(data_objects)
+        if result.errors:
+            raise BatchWriteError(result.errors)
 
     async def add_chunks(self, chunks: List[Chunk]) -> None:
-        await self._ensure_collection()
-        collection = self.client.collections.get(self.collection_name)
+        collection = await self._ensure_collection()
 
         data_objects = []
         for chunk in chunks:
             if chunk.embedding is None:
                 continue  # Skip chunks without embeddings
 
+            source = chunk.metadata.get("source", "unknown")
+            page_number = chunk.metadata.get("page_number", 0)
             props = {
                 "text": chunk.text,
-                "source": chunk.metadata.get("source", "unknown"),
-                "page_number": chunk.metadata.get("page_number", 0),
+                "source": source,
+                "page_number": page_number,
+                "page_key": _page_key(source, page_number),
             }
-            data_objects.append(DataObject(properties=props, vector=chunk.embedding))
+            if chunk.metadata.get("canonical_id"):
+                props["canonical_id"] = chunk.metadata["canonical_id"]
+            data_objects.append(
+                DataObject(properties=props, vector=chunk.embedding, uuid=chunk.id)
+            )
 
         if data_objects:
-            await collection.data.insert_many(data_objects)
+            await self._write(collection, data_objects)
 
-    async def search(self, query_vector: List[float], limit: int = 5) -> List[Chunk]:
-        exists = await self.client.collections.exists(self.collection_name)
-        if not exists:
+    async def search(
+        self,
+        query_vector: List[float],
+        limit: int = 5,
+        pages: Optional[List[PageSummary]] = None,
+    ) -> List[Chunk]:
+        collection = await self._get_existing(self.collection_name)
+        if collection is None:
             return []
 
-        collection = self.client.collections.get(self.collection_name)
+        filters = None
+        if pages:
+            filters = wvq.Filter.by_property("page_key").contains_any(
+                [_page_key(page.source, page.page_number) for page in pages]
+            )
+
         response = await collection.query.near_vector(
             near_vector=query_vector,
             limit=limit,
+            filters=filters,
             return_metadata=wvq.MetadataQuery(distance=True),
         )
 
@@ -67,6 +196,135 @@ class WeaviateRepository(VectorStoreRepository):
                         "page_number": obj.properties.get("page_number"),
                         "distance": obj.metadata.distance,
                     },
+                    id=str(obj.uuid),
                 )
             )
         return results
+
+    async def get_embeddings(self, chunk_ids: List[str]) -> Dict[str, List[float]]:
+        if not chunk_ids:
+            return {}
+
+        collection = await self._ensure_collection()
+        response = await collection.query.fetch_objects_by_ids(
+            chunk_ids,
+            limit=len(chunk_ids),
+            include_vector=True,
+        )
+        return {
+            str(obj.uuid): obj.vector["default"]
+            for obj in response.objects
+            if obj.vector.get("default") is not None
+        }
+
+    async def iter_chunks(self, batch_size: int = 500) -> AsyncIterator[List[Chunk]]:
+        collection = await self._get_existing(self.collection_name)
+        if collection is None:
+            return
+
+        batch: List[Chunk] = []
+        async for obj in collection.iterator(
+            include_vector=True, cache_size=batch_size
+        ):
+            metadata = {
+                "source": obj.properties.get("source"),
+                "page_number": obj.properties.get("page_number"),
+            }
+            if obj.properties.get("canonical_id"):
+                metadata["canonical_id"] = obj.properties["canonical_id"]
+            batch.append(
+                Chunk(
+                    text=obj.properties.get("text", ""),
+                    embedding=obj.vector.get("default"),
+                    metadata=metadata,
+                    id=str(obj.uuid),
+                )
+            )
+            if len(batch) == batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    async def add_page_summaries(self, pages: List[PageSummary]) -> None:
+        collection = await self._ensure_page_collection()
+
+        # Page ids derive from source and page number, so re-ingesting a
+        # document replaces its page vectors instead of duplicating them
+        data_objects = [
+            DataObject(
+                properties={
+                    "source": page.source,
+                    "page_number": page.page_number,
+                    "chunk_count": page.chunk_count,
+                    "page_key": _page_key(page.source, page.page_number),
+                },
+                vector=page.embedding,
+                uuid=_page_key(page.source, page.page_number),
+            )
+            for page in pages
+            if page.embedding is not None
+        ]
+
+        if data_objects:
+            await self._write(collection, data_objects)
+
+    async def get_page_summaries(
+        self, pages: List[PageSummary]
+    ) -> List[PageSummary]:
+        if not pages:
+            return []
+
+        collection = await self._get_existing(self.page_collection_name)
+        if collection is None:
+            return []
+
+        page_keys = list({_page_key(p.source, p.page_number) for p in pages})
+        response = await collection.query.fetch_objects_by_ids(
+            page_keys,
+            limit=len(page_keys),
+            include_vector=True,
+        )
+        return [
+            PageSummary(
+                source=obj.properties.get("source"),
+                page_number=obj.properties.get("page_number"),
+                embedding=obj.vector.get("default"),
+                chunk_count=obj.properties.get("chunk_count", 0),
+            )
+            for obj in response.objects
+        ]
+
+    async def search_pages(
+        self, query_vector: List[float], limit: int = 10
+    ) -> List[PageSummary]:
+        collection = await self._get_existing(self.page_collection_name)
+        if collection is None:
+            return []
+
+        response = await collection.query.near_vector(
+            near_vector=query_vector,
+            limit=limit,
+        )
+        return [
+            PageSummary(
+                source=obj.properties.get("source"),
+                page_number=obj.properties.get("page_number"),
+                chunk_count=obj.properties.get("chunk_count", 0),
+            )
+            for obj in response.objects
+        ]
+
+    async def list_pages(self) -> List[PageSummary]:
+        collection = await self._get_existing(self.page_collection_name)
+        if collection is None:
+            return []
+
+        return [
+            PageSummary(
+                source=obj.properties.get("source"),
+                page_number=obj.properties.get("page_number"),
+                chunk_count=obj.properties.get("chunk_count", 0),
+            )
+            async for obj in collection.iterator()
+        ]
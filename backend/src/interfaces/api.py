@@ -1,9 +1,27 @@
-from typing import List
+import json
+from dataclasses import asdict
+from typing import AsyncIterator, List, Optional, Tuple, Union
 from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
-from pydantic import BaseModel
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel, ValidationError
+from starlette.background import BackgroundTask
 from src.application.ingest_use_case import IngestDocumentUseCase
 from src.application.chat_use_case import ChatUseCase
-from src.dependencies import get_ingest_use_case, get_chat_use_case
+from src.application.batch_chat_use_case import (
+    BatchChatUseCase,
+    BatchChatItem,
+    BatchChatResult,
+)
+from src.application.admission_controller import (
+    AdmissionController,
+    AdmissionRejected,
+)
+from src.dependencies import (
+    get_ingest_use_case,
+    get_chat_use_case,
+    get_batch_chat_use_case,
+    get_admission_controller,
+)
 from src.domain.entities import ChatMessage
 
 router = APIRouter(prefix="/api")
@@ -29,10 +47,29 @@ class ChatResponseModel(BaseModel):
     citations: List[CitationModel]
 
 
+class BatchChatRequestLine(BaseModel):
+    id: Optional[Union[str, int]] = None
+    query: str
+    history: List[Message] = []
+
+
+def _rejection_to_http(rejection: AdmissionRejected) -> HTTPException:
+    """
+    Maps an admission rejection to 429 (queue full) or 503 (timed out).
+    """
+    status_code = 429 if rejection.reason == "queue_full" else 503
+    return HTTPException(
+        status_code=status_code,
+        detail=str(rejection),
+        headers={"Retry-After": str(rejection.retry_after)},
+    )
+
+
 @router.post("/ingest")
 async def ingest_document(
     file: UploadFile = File(...),
     use_case: IngestDocumentUseCase = Depends(get_ingest_use_case),
+    admission: AdmissionController = Depends(get_admission_controller),
 ):
     """
     Uploads and ingests a PDF document.
@@ -42,8 +79,17 @@ async def ingest_document(
 
     try:
         content = await file.read()
-        await use_case.execute(file_source=content, source_name=file.filename)
-        return {"message": "Document ingested successfully", "filename": file.filename}
+        async with admission.admit("ingest"):
+            report = await use_case.execute(
+                file_source=content, source_name=file.filename
+            )
+        return {
+            "message": "Document ingested successfully",
+            "filename": file.filename,
+            **asdict(report),
+        }
+    except AdmissionRejected as e:
+        raise _rejection_to_http(e)
     except Exception as e:
         print(f"Ingestion error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -53,6 +99,7 @@ async def ingest_document(
 async def chat(
     request: ChatRequest,
     use_case: ChatUseCase = Depends(get_chat_use_case),
+    admission: AdmissionController = Depends(get_admission_controller),
 ):
     """
     Answers a question based on ingested documents.
@@ -63,7 +110,10 @@ async def chat(
             ChatMessage(role=m.role, content=m.content) for m in request.history
         ]
 
-        response = await use_case.execute(query=request.query, history=history_entities)
+        async with admission.admit("chat"):
+            response = await use_case.execute(
+                query=request.query, history=history_entities
+            )
 
         # Convert domain response to Pydantic model
         return ChatResponseModel(
@@ -73,6 +123,96 @@ async def chat(
                 for c in response.citations
             ],
         )
+    except AdmissionRejected as e:
+        raise _rejection_to_http(e)
     except Exception as e:
         print(f"Chat error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+def _parse_batch_lines(
+    lines: List[str],
+) -> Tuple[List[BatchChatItem], List[BatchChatResult]]:
+    """
+    Parses JSONL questions, returning the valid items and an error result
+    for each malformed line. Numeric ids are returned as strings. Lines
+    without a usable id are identified as "line:<number>", which cannot be
+    mistaken for a numeric id from the file.
+    """
+    items = []
+    errors = []
+    for line_number, line in enumerate(lines, start=1):
+        if not line.strip():
+            continue
+        try:
+            parsed = BatchChatRequestLine.model_validate_json(line)
+        except ValidationError as e:
+            errors.append(
+                BatchChatResult(
+                    id=f"line:{line_number}", query="", error=f"Invalid line: {e}"
+                )
+            )
+            continue
+        items.append(
+            BatchChatItem(
+                id=str(parsed.id) if parsed.id is not None else f"line:{line_number}",
+                query=parsed.query,
+                history=[
+                    ChatMessage(role=m.role, content=m.content)
+                    for m in parsed.history
+                ],
+            )
+        )
+    return items, errors
+
+
+@router.post("/chat/batch")
+async def chat_batch(
+    file: UploadFile = File(...),
+    use_case: BatchChatUseCase = Depends(get_batch_chat_use_case),
+    admission: AdmissionController = Depends(get_admission_controller),
+):
+    """
+    Answers a JSONL file of questions, one JSON object per line with a
+    `query` and optional `id` and `history`. Results are streamed back as
+    JSONL in completion order, each with `latency_ms` and `error` fields.
+    """
+    try:
+        content = await file.read()
+        lines = content.decode("utf-8").splitlines()
+    except UnicodeDecodeError:
+        raise HTTPException(status_code=400, detail="File must be UTF-8 JSONL")
+
+    items, errors = _parse_batch_lines(lines)
+
+    try:
+        ticket = await admission.acquire("batch")
+    except AdmissionRejected as e:
+        raise _rejection_to_http(e)
+
+    async def stream() -> AsyncIterator[str]:
+        try:
+            for result in errors:
+                yield json.dumps(asdict(result)) + "\n"
+            async for result in use_case.execute(items):
+                yield json.dumps(asdict(result)) + "\n"
+        finally:
+            ticket.release()
+
+    # The background task covers clients that disconnect before streaming
+    # starts; releasing twice is a no-op.
+    return StreamingResponse(
+        stream(),
+        media_type="application/x-ndjson",
+        background=BackgroundTask(ticket.release),
+    )
+
+
+@router.get("/metrics/admission")
+async def admission_metrics(
+    admission: AdmissionController = Depends(get_admission_controller),
+):
+    """
+    Returns queue depths, wait times and rejection counts per workload.
+    """
+    return admission.snapshot()
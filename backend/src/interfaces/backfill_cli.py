@@ -0,0 +1,62 @@
+"""
+Builds page vectors for chunks ingested without them, so that
+RETRIEVAL_MODE=hierarchical can reach every document.
+
+Usage:
+    python -m src.interfaces.backfill_cli
+
+Page vectors are mean-pooled from the stored chunk embeddings, so no
+embedding calls are made. Pages that already have a vector are skipped,
+so the command can be run again safely.
+"""
+
+import argparse
+import asyncio
+import sys
+import weaviate
+from src.application.backfill_page_index_use_case import (
+    BackfillPageIndexUseCase,
+    BackfillReport,
+)
+from src.infrastructure.weaviate_repo import WeaviateRepository
+
+
+async def run_backfill(batch_size: int) -> BackfillReport:
+    """Connects to the local Weaviate instance and runs the backfill."""
+    client = weaviate.use_async_with_local()
+    await client.connect()
+    try:
+        repo = WeaviateRepository(client=client)
+        # Also adds properties introduced since the collections were created
+        await repo._ensure_collection()
+        await repo._ensure_page_collection()
+        use_case = BackfillPageIndexUseCase(repo=repo, batch_size=batch_size)
+        return await use_case.execute()
+    finally:
+        await client.close()
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Build page vectors for chunks ingested without them."
+    )
+    parser.add_argument(
+        "--batch-size",
+        type=int,
+        default=500,
+        help="Chunks read and rewritten per batch",
+    )
+    args = parser.parse_args(argv)
+
+    report = asyncio.run(run_backfill(args.batch_size))
+    print(
+        f"{report.chunks_scanned} chunks scanned, "
+        f"{report.chunks_updated} updated, "
+        f"{report.pages_written} page vectors written",
+        file=sys.stderr,
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Command-line client for the batch chat endpoint.
+
+Usage:
+    python -m src.interfaces.batch_cli questions.jsonl -o results.jsonl
+
+Each input line is a JSON object with a `query` and optional `id` and
+`history`. Results are written as JSONL in completion order.
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+import httpx
+
+
+def run_batch(input_path: Path, url: str, output) -> int:
+    """
+    Streams a JSONL file of questions through `/api/chat/batch`.
+
+    Returns:
+        The process exit code: 0 if every item succeeded, 1 otherwise.
+    """
+    total = 0
+    failed = 0
+    total_latency_ms = 0.0
+
+    with input_path.open("rb") as f, httpx.Client(timeout=None) as client:
+        with client.stream(
+            "POST",
+            f"{url.rstrip('/')}/api/chat/batch",
+            files={"file": (input_path.name, f, "application/x-ndjson")},
+        ) as response:
+            if response.status_code != 200:
+                response.read()
+                retry_after = response.headers.get("Retry-After")
+                hint = f" (retry after {retry_after}s)" if retry_after else ""
+                print(
+                    f"Batch rejected: HTTP {response.status_code}{hint}: "
+                    f"{response.text}",
+                    file=sys.stderr,
+                )
+                return 1
+
+            for line in response.iter_lines():
+                if not line:
+                    continue
+                output.write(line + "\n")
+                result = json.loads(line)
+                total += 1
+                total_latency_ms += result.get("latency_ms", 0.0)
+                if result.get("error"):
+                    failed += 1
+
+    mean_latency_ms = total_latency_ms / total if total else 0.0
+    print(
+        f"{total} results, {failed} errors, "
+        f"mean latency {mean_latency_ms:.0f} ms",
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Answer a JSONL file of questions via the batch chat API."
+    )
+    parser.add_argument("input", type=Path, help="JSONL file of questions")
+    parser.add_argument(
+        "-o",
+        "--output",
+        type=Path,
+        help="Where to write JSONL results (default: stdout)",
+    )
+    parser.add_argument(
+        "--url",
+        default="http://localhost:8000",
+        help="Base URL of the RAG Chatbot API",
+    )
+    args = parser.parse_args(argv)
+
+    if args.output:
+        with args.output.open("w", encoding="utf-8") as output:
+            return run_batch(args.input, args.url, output)
+    return run_batch(args.input, args.url, sys.stdout)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
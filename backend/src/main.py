@@ -1,54 +1,99 @@
+import os
 from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import weaviate
+from weaviate.classes.init import AdditionalConfig
 from src.infrastructure.gemini_service import (
     GeminiService,
     GeminiEmbeddingService,
 )
 from src.infrastructure.pdf_parser import PDFParser
 from src.infrastructure.weaviate_repo import WeaviateRepository
+from src.infrastructure.minhash_index import MinHashLSHIndex
+from src.infrastructure.caches import InMemoryCache, SQLiteCache
+from src.infrastructure.cached_services import (
+    CachedEmbeddingService,
+    CachedLLMService,
+)
 from src.application.ingest_use_case import IngestDocumentUseCase
 from src.application.chat_use_case import ChatUseCase
-from src import dependencies
+from src.application.batch_chat_use_case import BatchChatUseCase
+from src import dependencies, workers
 from src.interfaces.api import router as api_router
 
 # Global variables for dependencies
 weaviate_client = None
+cache = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global weaviate_client
+    global weaviate_client, cache
+
+    # Stagger worker start-up so N workers do not connect and warm up at
+    # the same instant
+    await workers.stagger_startup()
 
     # Initialize Weaviate Client
     # Connect to local Weaviate instance
     # (assumes running via docker-compose on port 8080)
-    weaviate_client = weaviate.use_async_with_local()
+    weaviate_client = weaviate.use_async_with_local(
+        additional_config=AdditionalConfig(connection=workers.connection_config())
+    )
     await weaviate_client.connect()
 
+    # Embedding and answer caches. Set CACHE_PATH to share one on-disk
+    # cache between worker processes; otherwise each keeps its own.
+    cache_path = os.getenv("CACHE_PATH")
+    cache = SQLiteCache(cache_path) if cache_path else InMemoryCache()
+
     # Initialize Infrastructure
     # Note: Ensure GOOGLE_API_KEY is set in environment variables
-    gemini_service = GeminiService()
-    embedding_service = GeminiEmbeddingService()
+    gemini_service = CachedLLMService(GeminiService(), cache)
+    embedding_service = CachedEmbeddingService(GeminiEmbeddingService(), cache)
     pdf_parser = PDFParser()
     weaviate_repo = WeaviateRepository(client=weaviate_client)
 
-    # Ensure Weaviate collection exists
-    # Accessing protected method for initialization
+    # Near-duplicate detection shared across documents. Set
+    # DEDUP_INDEX_PATH to keep the index across restarts; with several
+    # workers each keeps its own index in its own file.
+    duplicate_index = MinHashLSHIndex(
+        path=workers.worker_path(os.getenv("DEDUP_INDEX_PATH"))
+    )
+
+    # Ensure Weaviate collections exist and cache their handles
+    # Accessing protected methods for initialization
     await weaviate_repo._ensure_collection()
+    await weaviate_repo._ensure_page_collection()
 
     # Initialize Use Cases
     dependencies.ingest_use_case = IngestDocumentUseCase(
         parser=pdf_parser,
         repo=weaviate_repo,
         embedding_service=embedding_service,
+        duplicate_index=duplicate_index,
+        duplicate_mode=os.getenv("DEDUP_MODE", "skip"),
+        # Page vectors are cheap to keep, so they are always built and
+        # RETRIEVAL_MODE can be switched without re-ingesting
+        build_page_index=True,
     )
 
     dependencies.chat_use_case = ChatUseCase(
         repo=weaviate_repo,
         llm_service=gemini_service,
         embedding_service=embedding_service,
+        retrieval_mode=os.getenv("RETRIEVAL_MODE", "flat"),
+    )
+
+    # Separate concurrency pools for chat, batch chat and ingestion, sized
+    # for this worker's share of the upstream capacity
+    dependencies.admission_controller = workers.admission_controller()
+
+    # Batch chat takes an upstream slot per call, at batch priority
+    dependencies.batch_chat_use_case = BatchChatUseCase(
+        chat_use_case=dependencies.chat_use_case,
+        admission_controller=dependencies.admission_controller,
     )
 
     yield
@@ -56,6 +101,8 @@ async def lifespan(app: FastAPI):
     # Cleanup
     if weaviate_client:
         await weaviate_client.close()
+    if isinstance(cache, SQLiteCache):
+        cache.close()
 
 
 app = FastAPI(title="RAG Chatbot API", lifespan=lifespan)
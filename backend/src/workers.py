@@ -0,0 +1,96 @@
+"""
+Per-worker sizing for `uvicorn --workers N`, shared by `src.main` and the
+benchmark app so that both run the same configuration.
+"""
+
+import asyncio
+import os
+import random
+from typing import IO, List, Optional
+from weaviate.config import ConnectionConfig
+from src.application.admission_controller import AdmissionController
+
+# Worker processes started by `uvicorn --workers N`. Uvicorn reads the same
+# variable as its default, so set WEB_CONCURRENCY rather than --workers to
+# let each worker size its share of the connection pools.
+WORKERS = max(1, int(os.getenv("WEB_CONCURRENCY", "1")))
+
+# Upstream (Gemini/Weaviate) calls in flight at once, all workers together
+TOTAL_UPSTREAM_CAPACITY = 8
+
+# Lock files held open for the life of the process by `worker_path`
+_slot_locks: List[IO] = []
+
+
+def connection_config(workers: int = WORKERS) -> ConnectionConfig:
+    """
+    Splits the default Weaviate HTTP connection pool between workers so
+    that N workers together open about as many connections as one.
+    """
+    defaults = ConnectionConfig()
+    return ConnectionConfig(
+        session_pool_connections=max(2, defaults.session_pool_connections // workers),
+        session_pool_maxsize=max(10, defaults.session_pool_maxsize // workers),
+    )
+
+
+def admission_controller(workers: int = WORKERS) -> AdmissionController:
+    """
+    Separate concurrency pools for chat, batch chat and ingestion, with
+    interactive chat given priority on the shared upstream capacity. That
+    capacity is split between workers like the connection pool, but never
+    below two slots so one can stay reserved for chat.
+    """
+    return AdmissionController(
+        upstream_capacity=max(2, TOTAL_UPSTREAM_CAPACITY // workers)
+    )
+
+
+def startup_stagger_seconds(workers: int = WORKERS) -> float:
+    """Upper bound of the random delay before a worker starts up."""
+    return float(os.getenv("STARTUP_STAGGER_SECONDS", "2" if workers > 1 else "0"))
+
+
+async def stagger_startup(workers: int = WORKERS) -> None:
+    """
+    Sleeps a random delay so N workers do not connect and warm up at the
+    same instant.
+    """
+    stagger = startup_stagger_seconds(workers)
+    if stagger > 0:
+        await asyncio.sleep(random.uniform(0, stagger))
+
+
+def worker_path(path: Optional[str], workers: int = WORKERS) -> Optional[str]:
+    """
+    Gives this worker its own file derived from `path`, for state such as
+    the near-duplicate index that cannot be shared between processes.
+
+    The worker claims the first free slot `<path>.<n>` by holding a lock on
+    `<path>.<n>.lock` until it exits, so a restarted worker picks up a file
+    left by the one it replaces.
+
+    Args:
+        path: The configured path, or None.
+        workers: Number of worker processes.
+
+    Returns:
+        `path` itself for a single worker, otherwise this worker's path.
+    """
+    if path is None or workers <= 1:
+        return path
+
+    import fcntl
+
+    for slot in range(workers):
+        lock = open(f"{path}.{slot}.lock", "a")
+        try:
+            fcntl.flock(lock, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock.close()
+            continue
+        _slot_locks.append(lock)
+        return f"{path}.{slot}"
+
+    # Every slot is held, e.g. by a worker that has not exited yet
+    return f"{path}.pid{os.getpid()}"
@@ -0,0 +1,17 @@
+from src.interfaces.api import _parse_batch_lines
+
+
+def test_parse_batch_lines_accepts_numeric_ids_and_labels_line_ids():
+    lines = [
+        '{"id": 7, "query": "Numeric id?"}',
+        '{"id": "q2", "query": "String id?"}',
+        '{"query": "No id?"}',
+        "",
+        '{"id": 7.5, "query": "Bad id?"}',
+    ]
+
+    items, errors = _parse_batch_lines(lines)
+
+    assert [item.id for item in items] == ["7", "q2", "line:3"]
+    assert [error.id for error in errors] == ["line:5"]
+    assert errors[0].error.startswith("Invalid line")
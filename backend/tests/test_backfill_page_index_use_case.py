@@ -0,0 +1,66 @@
+import pytest
+from unittest.mock import Mock, AsyncMock
+from src.application.backfill_page_index_use_case import BackfillPageIndexUseCase
+from src.application.chat_use_case import ChatUseCase
+from src.application.ingest_use_case import IngestDocumentUseCase
+from src.domain.entities import Document
+from src.domain.interfaces import DocumentParser, EmbeddingService, LLMService
+from src.infrastructure.in_memory_repo import InMemoryVectorRepository
+
+VECTORS = {
+    "Legacy page about alpha.": [1.0, 0.0],
+    "New page about beta.": [0.0, 1.0],
+}
+
+
+async def _ingest(repo, text: str, source: str, build_page_index: bool) -> None:
+    parser = Mock(spec=DocumentParser)
+    parser.parse = AsyncMock(
+        return_value=[Document(content=text, metadata={"page_number": 1})]
+    )
+    embedding_service = Mock(spec=EmbeddingService)
+    embedding_service.embed_documents = AsyncMock(
+        side_effect=lambda texts: [VECTORS[t] for t in texts]
+    )
+    ingest_use_case = IngestDocumentUseCase(
+        parser=parser,
+        repo=repo,
+        embedding_service=embedding_service,
+        build_page_index=build_page_index,
+    )
+    await ingest_use_case.execute(b"fake pdf content", source_name=source)
+
+
+@pytest.mark.asyncio
+async def test_backfill_makes_legacy_pages_reachable_in_mixed_corpus():
+    # Setup: one document from before the page index, one from after
+    repo = InMemoryVectorRepository()
+    await _ingest(repo, "Legacy page about alpha.", "legacy.pdf", False)
+    await _ingest(repo, "New page about beta.", "new.pdf", True)
+
+    chat_use_case = ChatUseCase(
+        repo=repo,
+        llm_service=Mock(spec=LLMService),
+        embedding_service=Mock(spec=EmbeddingService),
+        retrieval_mode="hierarchical",
+    )
+    query = [1.0, 0.0]
+    before = await chat_use_case.retrieve(query)
+
+    # Execute
+    report = await BackfillPageIndexUseCase(repo=repo, batch_size=1).execute()
+    after = await chat_use_case.retrieve(query)
+
+    # Verify the legacy chunk was only reachable after the backfill
+    assert [c.metadata["source"] for c in before] == ["new.pdf"]
+    assert after[0].metadata["source"] == "legacy.pdf"
+
+    assert report.chunks_scanned == 2
+    assert report.chunks_updated == 1
+    assert report.pages_written == 1
+    assert repo.pages[("legacy.pdf", 1)].embedding == [1.0, 0.0]
+
+    # Verify a second run has nothing left to do
+    report = await BackfillPageIndexUseCase(repo=repo).execute()
+    assert report.chunks_updated == 0
+    assert report.pages_written == 0
@@ -0,0 +1,227 @@
+import asyncio
+import pytest
+from unittest.mock import Mock, AsyncMock
+from src.application.admission_controller import AdmissionController
+from src.application.chat_use_case import ChatUseCase
+from src.application.batch_chat_use_case import BatchChatUseCase, BatchChatItem
+from src.domain.entities import Chunk
+from src.domain.interfaces import (
+    VectorStoreRepository,
+    LLMService,
+    EmbeddingService,
+)
+
+
+@pytest.fixture
+def mock_repo():
+    return Mock(spec=VectorStoreRepository)
+
+
+@pytest.fixture
+def mock_llm_service():
+    return Mock(spec=LLMService)
+
+
+@pytest.fixture
+def mock_embedding_service():
+    return Mock(spec=EmbeddingService)
+
+
+@pytest.fixture
+def batch_chat_use_case(mock_repo, mock_llm_service, mock_embedding_service):
+    chat_use_case = ChatUseCase(
+        repo=mock_repo,
+        llm_service=mock_llm_service,
+        embedding_service=mock_embedding_service,
+    )
+    return BatchChatUseCase(chat_use_case=chat_use_case, embed_batch_size=2)
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_success(
+    batch_chat_use_case, mock_repo, mock_llm_service, mock_embedding_service
+):
+    # Setup mocks
+    items = [BatchChatItem(id=str(i), query=f"Question {i}?") for i in range(3)]
+
+    mock_embedding_service.embed_queries = AsyncMock(
+        side_effect=lambda texts: [[0.1, 0.2] for _ in texts]
+    )
+    mock_embedding_service.embed_text = AsyncMock()
+    mock_repo.search = AsyncMock(
+        return_value=[
+            Chunk(text="Fact.", metadata={"source": "doc1.pdf", "page_number": 1})
+        ]
+    )
+    mock_llm_service.generate_response = AsyncMock(return_value="Answer.")
+
+    # Execute
+    results = [result async for result in batch_chat_use_case.execute(items)]
+
+    # Verify queries were embedded in batches rather than one by one
+    assert mock_embedding_service.embed_queries.call_count == 2
+    mock_embedding_service.embed_text.assert_not_called()
+    assert mock_repo.search.call_count == 3
+
+    assert sorted(r.id for r in results) == ["0", "1", "2"]
+    for result in results:
+        assert result.error is None
+        assert result.answer == "Answer."
+        assert result.citations[0].source == "doc1.pdf"
+        assert result.latency_ms >= 0
+
+
+@pytest.mark.asyncio
+async def test_batch_execute_reports_per_item_errors(
+    batch_chat_use_case, mock_repo, mock_llm_service, mock_embedding_service
+):
+    # Setup mocks: the first embedding batch fails, one generation fails
+    items = [BatchChatItem(id=str(i), query=f"Question {i}?") for i in range(4)]
+
+    mock_embedding_service.embed_queries = AsyncMock(
+        side_effect=[RuntimeError("quota exceeded"), [[0.1], [0.2]]]
+    )
+    mock_repo.search = AsyncMock(return_value=[])
+
+    async def generate(query, context, history):
+        if query == "Question 3?":
+            raise RuntimeError("LLM down")
+        return "Answer."
+
+    mock_llm_service.generate_response = AsyncMock(side_effect=generate)
+
+    # Execute
+    results = {r.id: r async for r in batch_chat_use_case.execute(items)}
+
+    # Verify
+    assert "quota exceeded" in results["0"].error
+    assert "quota exceeded" in results["1"].error
+    assert results["2"].answer == "Answer."
+    assert results["2"].error is None
+    assert results["3"].answer is None
+    assert results["3"].error == "LLM down"
+
+
+@pytest.mark.asyncio
+async def test_batch_takes_upstream_slot_per_call(
+    mock_repo, mock_llm_service, mock_embedding_service
+):
+    # Setup: a single upstream slot shared with chat
+    controller = AdmissionController(upstream_capacity=1)
+    batch_chat_use_case = BatchChatUseCase(
+        chat_use_case=ChatUseCase(
+            repo=mock_repo,
+            llm_service=mock_llm_service,
+            embedding_service=mock_embedding_service,
+        ),
+        admission_controller=controller,
+    )
+    items = [BatchChatItem(id=str(i), query=f"Question {i}?") for i in range(2)]
+    mock_embedding_service.embed_queries = AsyncMock(
+        side_effect=lambda texts: [[0.1] for _ in texts]
+    )
+    mock_repo.search = AsyncMock(return_value=[])
+    order = []
+    generating = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def generate(query, context, history):
+        order.append(query)
+        generating.set()
+        await finish.wait()
+        return "Answer."
+
+    mock_llm_service.generate_response = AsyncMock(side_effect=generate)
+
+    async def chat():
+        async with controller.admit("chat"):
+            order.append("chat")
+
+    # Execute: chat arrives while the batch holds the only upstream slot
+    ticket = await controller.acquire("batch")
+    consumer = asyncio.create_task(_collect(batch_chat_use_case.execute(items)))
+    await generating.wait()
+    chat_task = asyncio.create_task(chat())
+    await asyncio.sleep(0.01)
+    finish.set()
+    results = await consumer
+    await chat_task
+    ticket.release()
+
+    # Verify chat was served before the batch's second call
+    assert order[1] == "chat"
+    assert len(results) == 2
+    assert controller.snapshot()["upstream"]["available"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batch_embeds_queries_under_upstream_slot(
+    mock_repo, mock_llm_service, mock_embedding_service
+):
+    # Setup
+    controller = AdmissionController(upstream_capacity=1)
+    batch_chat_use_case = BatchChatUseCase(
+        chat_use_case=ChatUseCase(
+            repo=mock_repo,
+            llm_service=mock_llm_service,
+            embedding_service=mock_embedding_service,
+        ),
+        admission_controller=controller,
+    )
+    available_while_embedding = []
+
+    async def embed_queries(texts):
+        available_while_embedding.append(controller.upstream.available)
+        return [[0.1] for _ in texts]
+
+    mock_embedding_service.embed_queries = AsyncMock(side_effect=embed_queries)
+    mock_repo.search = AsyncMock(return_value=[])
+    mock_llm_service.generate_response = AsyncMock(return_value="Answer.")
+
+    # Execute
+    items = [BatchChatItem(id="1", query="Question?")]
+    results = await _collect(batch_chat_use_case.execute(items))
+
+    # Verify the embedding call held the only upstream slot
+    assert available_while_embedding == [0]
+    assert results[0].answer == "Answer."
+    assert controller.upstream.available == 1
+
+
+async def _collect(results):
+    return [result async for result in results]
+
+
+@pytest.mark.asyncio
+async def test_batch_does_not_run_ahead_of_consumer(
+    mock_repo, mock_llm_service, mock_embedding_service
+):
+    # Setup: room for a single embedding batch of unread results
+    batch_chat_use_case = BatchChatUseCase(
+        chat_use_case=ChatUseCase(
+            repo=mock_repo,
+            llm_service=mock_llm_service,
+            embedding_service=mock_embedding_service,
+        ),
+        embed_batch_size=2,
+        max_pending=2,
+    )
+    items = [BatchChatItem(id=str(i), query=f"Question {i}?") for i in range(6)]
+    mock_embedding_service.embed_queries = AsyncMock(
+        side_effect=lambda texts: [[0.1] for _ in texts]
+    )
+    mock_repo.search = AsyncMock(return_value=[])
+    mock_llm_service.generate_response = AsyncMock(return_value="Answer.")
+
+    # Execute: read one result, then stall
+    results = batch_chat_use_case.execute(items)
+    first = await results.__anext__()
+    await asyncio.sleep(0.01)
+
+    # Verify the next batch waits until earlier results are consumed
+    assert first.answer == "Answer."
+    assert mock_embedding_service.embed_queries.call_count == 1
+
+    rest = [result async for result in results]
+    assert len(rest) == 5
+    assert mock_embedding_service.embed_queries.call_count == 3
@@ -0,0 +1,105 @@
+import pytest
+from unittest.mock import Mock, AsyncMock
+from src.domain.entities import ChatMessage, Chunk
+from src.domain.interfaces import EmbeddingService, LLMService
+from src.infrastructure.caches import InMemoryCache, SQLiteCache
+from src.infrastructure.cached_services import (
+    CachedEmbeddingService,
+    CachedLLMService,
+)
+
+
+@pytest.fixture
+def mock_embedding_service():
+    return Mock(spec=EmbeddingService)
+
+
+@pytest.fixture
+def mock_llm_service():
+    return Mock(spec=LLMService)
+
+
+@pytest.mark.asyncio
+async def test_embed_queries_only_embeds_misses(mock_embedding_service):
+    service = CachedEmbeddingService(mock_embedding_service, InMemoryCache())
+    mock_embedding_service.embed_queries = AsyncMock(
+        side_effect=lambda texts: [[float(len(t)), 0.5] for t in texts]
+    )
+
+    first = await service.embed_queries(["a", "bb"])
+    second = await service.embed_queries(["bb", "ccc", "bb"])
+
+    assert first == [[1.0, 0.5], [2.0, 0.5]]
+    assert second == [[2.0, 0.5], [3.0, 0.5], [2.0, 0.5]]
+    calls = mock_embedding_service.embed_queries.call_args_list
+    assert [call.args[0] for call in calls] == [["a", "bb"], ["ccc"]]
+
+
+@pytest.mark.asyncio
+async def test_embed_documents_is_not_cached(mock_embedding_service):
+    cache = InMemoryCache()
+    service = CachedEmbeddingService(mock_embedding_service, cache)
+    mock_embedding_service.embed_documents = AsyncMock(return_value=[[1.0, 0.5]])
+
+    await service.embed_documents(["a"])
+    await service.embed_documents(["a"])
+
+    assert mock_embedding_service.embed_documents.call_count == 2
+    assert cache._size == 0
+
+
+@pytest.mark.asyncio
+async def test_generate_response_cached_by_query_context_and_history(
+    mock_llm_service,
+):
+    service = CachedLLMService(mock_llm_service, InMemoryCache())
+    mock_llm_service.generate_response = AsyncMock(return_value="Answer.")
+    context = [Chunk(text="Fact.")]
+    history = [ChatMessage(role="user", content="Hello")]
+
+    await service.generate_response("What?", context, history)
+    answer = await service.generate_response("What?", context, history)
+    await service.generate_response("What?", [Chunk(text="Other fact.")], history)
+
+    assert answer == "Answer."
+    assert mock_llm_service.generate_response.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_evicts_least_recently_used():
+    cache = InMemoryCache(max_bytes=8)  # Room for two 4-byte entries
+    await cache.set("a", b"111")
+    await cache.set("b", b"222")
+    await cache.get("a")
+    await cache.set("c", b"333")
+
+    assert await cache.get_many(["a", "b", "c"]) == {"a": b"111", "c": b"333"}
+
+    # A large value displaces several small ones
+    await cache.set("d", b"4444444")
+    assert await cache.get_many(["a", "c", "d"]) == {"d": b"4444444"}
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "cache.db")
+    writer = SQLiteCache(path)
+    reader = SQLiteCache(path)  # Stands in for another worker process
+
+    await writer.set_many({"a": b"1", "b": b"2"})
+
+    assert await reader.get("a") == b"1"
+    assert await reader.get_many(["a", "b", "missing"]) == {"a": b"1", "b": b"2"}
+    writer.close()
+    reader.close()
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_prunes_oldest_entries(tmp_path):
+    cache = SQLiteCache(str(tmp_path / "cache.db"), max_bytes=8, prune_interval=1)
+
+    for key in ["a", "b", "c"]:
+        await cache.set(key, key.encode() * 3)
+
+    assert await cache.get_many(["a", "b", "c"]) == {"b": b"bbb", "c": b"ccc"}
+    cache.close()
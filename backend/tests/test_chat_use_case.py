@@ -1,7 +1,7 @@
 import pytest
 from unittest.mock import Mock, AsyncMock
 from src.application.chat_use_case import ChatUseCase
-from src.domain.entities import ChatMessage, Chunk, Citation
+from src.domain.entities import ChatMessage, Chunk, Citation, PageSummary
 from src.domain.interfaces import (
     VectorStoreRepository,
     LLMService,
@@ -85,3 +85,51 @@ async def test_chat_execute_success(
     # Check second citation
     assert response.citations[1].source == "doc2.pdf"
     assert response.citations[1].page_number == 5
+
+
+@pytest.mark.asyncio
+async def test_chat_hierarchical_searches_within_top_pages(
+    mock_repo, mock_llm_service, mock_embedding_service
+):
+    chat_use_case = ChatUseCase(
+        repo=mock_repo,
+        llm_service=mock_llm_service,
+        embedding_service=mock_embedding_service,
+        retrieval_mode="hierarchical",
+        page_limit=3,
+    )
+    pages = [PageSummary(source="doc1.pdf", page_number=4)]
+    mock_embedding_service.embed_text = AsyncMock(return_value=[0.1, 0.2])
+    mock_repo.search_pages = AsyncMock(return_value=pages)
+    mock_repo.search = AsyncMock(
+        return_value=[
+            Chunk(text="Fact.", metadata={"source": "doc1.pdf", "page_number": 4})
+        ]
+    )
+    mock_llm_service.generate_response = AsyncMock(return_value="Answer.")
+
+    response = await chat_use_case.execute("What?", [])
+
+    mock_repo.search_pages.assert_called_once_with([0.1, 0.2], limit=3)
+    mock_repo.search.assert_called_once_with([0.1, 0.2], limit=5, pages=pages)
+    assert response.citations[0].page_number == 4
+
+
+@pytest.mark.asyncio
+async def test_chat_hierarchical_falls_back_without_page_index(
+    mock_repo, mock_llm_service, mock_embedding_service
+):
+    chat_use_case = ChatUseCase(
+        repo=mock_repo,
+        llm_service=mock_llm_service,
+        embedding_service=mock_embedding_service,
+        retrieval_mode="hierarchical",
+    )
+    mock_embedding_service.embed_text = AsyncMock(return_value=[0.1, 0.2])
+    mock_repo.search_pages = AsyncMock(return_value=[])
+    mock_repo.search = AsyncMock(return_value=[])
+    mock_llm_service.generate_response = AsyncMock(return_value="I don't know.")
+
+    await chat_use_case.execute("What?", [])
+
+    mock_repo.search.assert_called_once_with([0.1, 0.2], limit=5)
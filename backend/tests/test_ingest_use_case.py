@@ -1,7 +1,9 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, AsyncMock
 from src.application.ingest_use_case import IngestDocumentUseCase
-from src.domain.entities import Document, Chunk
+from src.domain.entities import Document, Chunk, PageSummary
+from src.infrastructure.minhash_index import MinHashLSHIndex
 from src.domain.interfaces import (
     DocumentParser,
     VectorStoreRepository,
@@ -78,3 +80,217 @@ async def test_ingest_document_success(
     assert call_args[0].metadata["source"] == "test.pdf"
     assert call_args[0].metadata["page_number"] == 1
     assert call_args[1].text == "This is page 2 content."
+
+
+@pytest.mark.asyncio
+async def test_ingest_links_near_duplicates(
+    mock_parser, mock_repo, mock_embedding_service
+):
+    # Setup: the same footer appears on both pages
+    ingest_use_case = IngestDocumentUseCase(
+        parser=mock_parser,
+        repo=mock_repo,
+        embedding_service=mock_embedding_service,
+        duplicate_index=MinHashLSHIndex(),
+        duplicate_mode="link",
+    )
+    footer = "Copyright 2024 Example Corp. All rights reserved worldwide."
+    mock_parser.parse = AsyncMock(
+        return_value=[
+            Document(content=footer, metadata={"page_number": 1}),
+            Document(content=footer, metadata={"page_number": 2}),
+        ]
+    )
+    mock_embedding_service.embed_documents = AsyncMock(return_value=[[0.1, 0.2]])
+    mock_repo.add_chunks = AsyncMock()
+    mock_repo.get_embeddings = AsyncMock(return_value={})
+
+    # Execute
+    report = await ingest_use_case.execute(b"fake pdf content", source_name="a.pdf")
+
+    # Verify only the first copy was embedded
+    assert mock_embedding_service.embed_documents.call_count == 1
+    mock_repo.get_embeddings.assert_not_called()
+
+    stored = mock_repo.add_chunks.call_args[0][0]
+    assert len(stored) == 2
+    assert stored[1].embedding == stored[0].embedding
+    assert stored[1].metadata["canonical_id"] == stored[0].id
+    assert stored[1].metadata["page_number"] == 2
+
+    assert report.chunks_total == 2
+    assert report.chunks_stored == 2
+    assert report.duplicates_linked == 1
+    assert report.embeddings_saved == 1
+
+
+@pytest.mark.asyncio
+async def test_ingest_skips_duplicates_across_documents(
+    mock_parser, mock_repo, mock_embedding_service
+):
+    duplicate_index = MinHashLSHIndex()
+    ingest_use_case = IngestDocumentUseCase(
+        parser=mock_parser,
+        repo=mock_repo,
+        embedding_service=mock_embedding_service,
+        duplicate_index=duplicate_index,
+        duplicate_mode="skip",
+    )
+    footer = "Copyright 2024 Example Corp. All rights reserved worldwide."
+    mock_parser.parse = AsyncMock(
+        return_value=[Document(content=footer, metadata={"page_number": 1})]
+    )
+    mock_embedding_service.embed_documents = AsyncMock(return_value=[[0.1, 0.2]])
+    mock_repo.add_chunks = AsyncMock()
+
+    # Execute: ingest two documents with the same content
+    await ingest_use_case.execute(b"first", source_name="a.pdf")
+    report = await ingest_use_case.execute(b"second", source_name="b.pdf")
+
+    # Verify the second document stored nothing
+    assert mock_repo.add_chunks.call_count == 1
+    assert report.chunks_stored == 0
+    assert report.duplicates_skipped == 1
+    assert report.embeddings_saved == 1
+
+
+@pytest.mark.asyncio
+async def test_ingest_failure_does_not_index_chunks(
+    mock_parser, mock_repo, mock_embedding_service
+):
+    duplicate_index = MinHashLSHIndex()
+    ingest_use_case = IngestDocumentUseCase(
+        parser=mock_parser,
+        repo=mock_repo,
+        embedding_service=mock_embedding_service,
+        duplicate_index=duplicate_index,
+    )
+    mock_parser.parse = AsyncMock(
+        return_value=[Document(content="Some page content.", metadata={})]
+    )
+    mock_embedding_service.embed_documents = AsyncMock(return_value=[[0.1]])
+    mock_repo.add_chunks = AsyncMock(side_effect=RuntimeError("store down"))
+
+    with pytest.raises(RuntimeError):
+        await ingest_use_case.execute(b"fake pdf content")
+
+    assert len(duplicate_index) == 0
+
+
+@pytest.mark.asyncio
+async def test_ingest_keeps_canonical_pending_in_concurrent_ingest(
+    mock_parser, mock_repo, mock_embedding_service
+):
+    # Setup: the first ingest is still storing the footer when the second
+    # one finds it as a duplicate
+    duplicate_index = MinHashLSHIndex()
+    ingest_use_case = IngestDocumentUseCase(
+        parser=mock_parser,
+        repo=mock_repo,
+        embedding_service=mock_embedding_service,
+        duplicate_index=duplicate_index,
+        duplicate_mode="link",
+    )
+    footer = "Copyright 2024 Example Corp. All rights reserved worldwide."
+    mock_parser.parse = AsyncMock(
+        return_value=[Document(content=footer, metadata={"page_number": 1})]
+    )
+    mock_embedding_service.embed_documents = AsyncMock(return_value=[[0.1, 0.2]])
+    mock_repo.get_embeddings = AsyncMock(return_value={})
+    storing = asyncio.Event()
+    finish = asyncio.Event()
+
+    async def add_chunks(chunks):
+        if not storing.is_set():
+            storing.set()
+            await finish.wait()
+
+    mock_repo.add_chunks = AsyncMock(side_effect=add_chunks)
+
+    # Execute
+    first = asyncio.create_task(ingest_use_case.execute(b"first", "a.pdf"))
+    await storing.wait()
+    report = await ingest_use_case.execute(b"second", source_name="b.pdf")
+    finish.set()
+    await first
+
+    # Verify the second copy was embedded without evicting the canonical
+    canonical = mock_repo.add_chunks.call_args_list[0][0][0][0]
+    orphan = mock_repo.add_chunks.call_args_list[1][0][0][0]
+    assert duplicate_index.find_duplicate(footer) == canonical.id
+    assert "canonical_id" not in orphan.metadata
+    assert orphan.embedding == [0.1, 0.2]
+    assert report.duplicates_linked == 0
+    assert ingest_use_case._in_flight_ids == set()
+
+
+@pytest.mark.asyncio
+async def test_ingest_builds_mean_pooled_page_index(
+    mock_parser, mock_repo, mock_embedding_service
+):
+    ingest_use_case = IngestDocumentUseCase(
+        parser=mock_parser,
+        repo=mock_repo,
+        embedding_service=mock_embedding_service,
+        chunk_size=30,
+        chunk_overlap=0,
+        build_page_index=True,
+    )
+    mock_parser.parse = AsyncMock(
+        return_value=[
+            Document(
+                content="First sentence on page one. Second sentence here.",
+                metadata={"page_number": 1},
+            ),
+            Document(content="Page two.", metadata={"page_number": 2}),
+        ]
+    )
+    mock_embedding_service.embed_documents = AsyncMock(
+        side_effect=[[[1.0, 0.0], [0.0, 1.0]], [[0.5, 0.5]]]
+    )
+    mock_repo.add_chunks = AsyncMock()
+    mock_repo.get_page_summaries = AsyncMock(return_value=[])
+    mock_repo.add_page_summaries = AsyncMock()
+
+    await ingest_use_case.execute(b"fake pdf content", source_name="a.pdf")
+
+    # Verify one page vector per page, averaged over its chunks
+    pages = mock_repo.add_page_summaries.call_args[0][0]
+    assert [(p.source, p.page_number, p.chunk_count) for p in pages] == [
+        ("a.pdf", 1, 2),
+        ("a.pdf", 2, 1),
+    ]
+    assert pages[0].embedding == [0.5, 0.5]
+    assert pages[1].embedding == [0.5, 0.5]
+
+
+@pytest.mark.asyncio
+async def test_ingest_merges_new_chunks_into_stored_page_vector(
+    mock_parser, mock_repo, mock_embedding_service
+):
+    # Setup: page 1 already has a vector pooled from two chunks
+    ingest_use_case = IngestDocumentUseCase(
+        parser=mock_parser,
+        repo=mock_repo,
+        embedding_service=mock_embedding_service,
+        build_page_index=True,
+    )
+    mock_parser.parse = AsyncMock(
+        return_value=[
+            Document(content="An added paragraph.", metadata={"page_number": 1})
+        ]
+    )
+    mock_embedding_service.embed_documents = AsyncMock(return_value=[[0.0, 1.0]])
+    mock_repo.add_chunks = AsyncMock()
+    mock_repo.get_page_summaries = AsyncMock(
+        return_value=[PageSummary("a.pdf", 1, embedding=[1.0, 0.0], chunk_count=2)]
+    )
+    mock_repo.add_page_summaries = AsyncMock()
+
+    # Execute
+    await ingest_use_case.execute(b"fake pdf content", source_name="a.pdf")
+
+    # Verify the stored page vector is extended, not overwritten
+    (page,) = mock_repo.add_page_summaries.call_args[0][0]
+    assert page.chunk_count == 3
+    assert page.embedding == pytest.approx([2 / 3, 1 / 3])
@@ -0,0 +1,93 @@
+from src.infrastructure.minhash_index import MinHashLSHIndex
+
+BOILERPLATE = (
+    "This document is confidential and intended solely for the use of the "
+    "individual to whom it is addressed. If you have received it in error "
+    "please notify the sender immediately and delete it from your system."
+)
+
+
+def test_finds_near_duplicate():
+    index = MinHashLSHIndex()
+    index.add("chunk-1", BOILERPLATE)
+
+    revised = BOILERPLATE.replace("immediately", "at once")
+
+    assert index.find_duplicate(BOILERPLATE) == "chunk-1"
+    assert index.find_duplicate(revised) == "chunk-1"
+    assert index.find_duplicate("Retrieval-Augmented Generation explained.") is None
+
+
+def test_remove_forgets_chunks():
+    index = MinHashLSHIndex()
+    index.add("chunk-1", BOILERPLATE)
+
+    index.remove(["chunk-1"])
+
+    assert index.find_duplicate(BOILERPLATE) is None
+    assert len(index) == 0
+
+
+def test_persist_survives_reload(tmp_path):
+    path = str(tmp_path / "dedup.jsonl")
+    index = MinHashLSHIndex(path=path)
+    index.add("chunk-1", BOILERPLATE)
+    index.add("chunk-2", "Something else entirely about vector databases.")
+    index.remove(["chunk-2"])
+    index.persist()
+
+    reloaded = MinHashLSHIndex(path=path)
+
+    assert len(reloaded) == 1
+    assert reloaded.find_duplicate(BOILERPLATE) == "chunk-1"
+
+
+def test_find_or_add_hashes_text_once():
+    index = MinHashLSHIndex()
+    signatures = []
+    signature = index._signature
+    index._signature = lambda text: signatures.append(text) or signature(text)
+
+    first = index.find_or_add("chunk-1", BOILERPLATE)
+    second = index.find_or_add("chunk-2", BOILERPLATE.replace("immediately", "now"))
+
+    assert first is None
+    assert second == "chunk-1"
+    assert len(signatures) == 2
+    assert len(index) == 1
+
+
+def test_load_skips_torn_trailing_line(tmp_path):
+    path = tmp_path / "dedup.jsonl"
+    index = MinHashLSHIndex(path=str(path))
+    index.add("chunk-1", BOILERPLATE)
+    index.persist()
+    # A crash in the middle of writing the next entry
+    with path.open("a", encoding="utf-8") as f:
+        f.write('{"op": "add", "id": "chunk-2", "sig": [1, 2')
+
+    reloaded = MinHashLSHIndex(path=str(path))
+    reloaded.add("chunk-3", "Something else entirely about vector databases.")
+    reloaded.persist()
+
+    assert len(reloaded) == 2
+    assert len(MinHashLSHIndex(path=str(path))) == 2
+    assert path.read_text(encoding="utf-8").endswith("\n")
+
+
+def test_persist_compacts_log(tmp_path):
+    path = tmp_path / "dedup.jsonl"
+    index = MinHashLSHIndex(path=str(path), compact_min_entries=4)
+    for i in range(3):
+        index.add(f"chunk-{i}", f"Document number {i} about a distinct topic.")
+        index.persist()
+    index.remove(["chunk-0", "chunk-1"])
+    index.persist()
+
+    lines = path.read_text(encoding="utf-8").splitlines()
+    reloaded = MinHashLSHIndex(path=str(path))
+
+    assert len(lines) == 1
+    assert len(reloaded) == 1
+    text = "Document number 2 about a distinct topic."
+    assert reloaded.find_duplicate(text) == "chunk-2"
@@ -0,0 +1,93 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock
+from weaviate.classes.data import DataObject
+from src.infrastructure.weaviate_batch_writer import WeaviateBatchWriter
+
+
+def make_objects(count):
+    return [
+        DataObject(properties={"text": f"chunk {i}"}, vector=[0.1, 0.2])
+        for i in range(count)
+    ]
+
+
+def make_response(errors):
+    return SimpleNamespace(
+        errors={i: SimpleNamespace(message=m) for i, m in errors.items()}
+    )
+
+
+@pytest.fixture
+def mock_collection():
+    collection = Mock()
+    collection.data.insert_many = AsyncMock(return_value=make_response({}))
+    return collection
+
+
+@pytest.mark.asyncio
+async def test_write_splits_into_batches(mock_collection):
+    writer = WeaviateBatchWriter(mock_collection, max_batch_objects=2)
+
+    result = await writer.write(make_objects(5))
+
+    assert result.inserted == 5
+    assert result.errors == []
+    batch_sizes = [
+        len(call.args[0]) for call in mock_collection.data.insert_many.call_args_list
+    ]
+    assert sorted(batch_sizes) == [1, 2, 2]
+    # UUIDs are assigned client-side so retries are idempotent
+    for call in mock_collection.data.insert_many.call_args_list:
+        assert all(obj.uuid is not None for obj in call.args[0])
+
+
+@pytest.mark.asyncio
+async def test_write_splits_by_size(mock_collection):
+    writer = WeaviateBatchWriter(
+        mock_collection, max_batch_objects=100, max_batch_bytes=40
+    )
+
+    await writer.write(make_objects(3))
+
+    assert mock_collection.data.insert_many.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_write_retries_only_failed_objects(mock_collection):
+    mock_collection.data.insert_many = AsyncMock(
+        side_effect=[
+            make_response({1: "timeout"}),
+            make_response({}),
+        ]
+    )
+    writer = WeaviateBatchWriter(mock_collection, retry_backoff=0)
+    objects = make_objects(3)
+
+    result = await writer.write(objects)
+
+    assert result.inserted == 3
+    assert result.errors == []
+    first, retry = mock_collection.data.insert_many.call_args_list
+    assert len(first.args[0]) == 3
+    assert [obj.properties["text"] for obj in retry.args[0]] == ["chunk 1"]
+    assert retry.args[0][0].uuid == first.args[0][1].uuid
+
+
+@pytest.mark.asyncio
+async def test_write_reports_per_object_errors(mock_collection):
+    mock_collection.data.insert_many = AsyncMock(
+        side_effect=[
+            make_response({0: "invalid property"}),
+            make_response({0: "invalid property"}),
+            ConnectionError("connection reset"),
+        ]
+    )
+    writer = WeaviateBatchWriter(mock_collection, max_retries=2, retry_backoff=0)
+
+    result = await writer.write(make_objects(2))
+
+    assert result.inserted == 1
+    assert len(result.errors) == 1
+    assert result.errors[0].index == 0
+    assert result.errors[0].message == "connection reset"
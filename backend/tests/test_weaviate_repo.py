@@ -0,0 +1,151 @@
+import pytest
+from types import SimpleNamespace
+from unittest.mock import Mock, AsyncMock
+from src.application.backfill_page_index_use_case import BackfillPageIndexUseCase
+from src.domain.entities import Chunk
+from src.infrastructure.weaviate_batch_writer import BatchWriteError
+from src.infrastructure.weaviate_repo import WeaviateRepository, _page_key
+
+CHUNK_PROPERTIES = ["text", "source", "page_number", "canonical_id", "page_key"]
+
+
+def make_chunk(i):
+    return Chunk(
+        text=f"chunk {i}",
+        embedding=[0.1, 0.2],
+        metadata={"source": "doc1.pdf", "page_number": 1},
+        id=f"00000000-0000-0000-0000-00000000000{i}",
+    )
+
+
+@pytest.fixture
+def mock_collection():
+    collection = Mock()
+    collection.config.get = AsyncMock(
+        return_value=SimpleNamespace(
+            properties=[SimpleNamespace(name=name) for name in CHUNK_PROPERTIES]
+        )
+    )
+    collection.config.add_property = AsyncMock()
+    collection.query.near_vector = AsyncMock(return_value=SimpleNamespace(objects=[]))
+    collection.data.insert_many = AsyncMock(return_value=SimpleNamespace(errors={}))
+    return collection
+
+
+@pytest.fixture
+def mock_client(mock_collection):
+    client = Mock()
+    client.collections.exists = AsyncMock(return_value=True)
+    client.collections.create = AsyncMock()
+    client.collections.get = Mock(return_value=mock_collection)
+    return client
+
+
+@pytest.mark.asyncio
+async def test_collection_existence_checked_once(mock_client, mock_collection):
+    repo = WeaviateRepository(client=mock_client)
+
+    await repo.add_chunks([make_chunk(1)])
+    await repo.search([0.1, 0.2])
+    await repo.search([0.1, 0.2])
+    await repo.add_chunks([make_chunk(2)])
+
+    mock_client.collections.exists.assert_called_once_with("Chunk")
+    mock_client.collections.create.assert_not_called()
+    assert mock_collection.query.near_vector.call_count == 2
+    assert mock_collection.data.insert_many.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_search_does_not_cache_missing_collection(
+    mock_client, mock_collection
+):
+    mock_client.collections.exists = AsyncMock(side_effect=[False, True])
+    repo = WeaviateRepository(client=mock_client)
+
+    # Nothing ingested yet
+    assert await repo.search([0.1, 0.2]) == []
+    mock_collection.query.near_vector.assert_not_called()
+
+    # The collection is picked up once it exists
+    await repo.search([0.1, 0.2])
+    assert mock_client.collections.exists.call_count == 2
+    mock_collection.query.near_vector.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_add_chunks_raises_batch_write_error(mock_client, mock_collection):
+    mock_collection.data.insert_many = AsyncMock(
+        return_value=SimpleNamespace(errors={0: SimpleNamespace(message="boom")})
+    )
+    repo = WeaviateRepository(client=mock_client, max_retries=0)
+
+    with pytest.raises(BatchWriteError) as exc_info:
+        await repo.add_chunks([make_chunk(1)])
+
+    assert exc_info.value.errors[0].message == "boom"
+
+
+def make_legacy_object(i):
+    """A Chunk object stored before page keys existed."""
+    return SimpleNamespace(
+        uuid=f"00000000-0000-0000-0000-00000000000{i}",
+        properties={"text": f"chunk {i}", "source": "old.pdf", "page_number": 1},
+        vector={"default": [float(i), 1.0]},
+    )
+
+
+async def _iterate(objects):
+    for obj in objects:
+        yield obj
+
+
+@pytest.mark.asyncio
+async def test_backfill_adds_page_key_to_legacy_chunks(mock_collection):
+    # Setup: a Chunk collection from before page keys and an empty Page one
+    mock_collection.config.get = AsyncMock(
+        return_value=SimpleNamespace(
+            properties=[
+                SimpleNamespace(name=name)
+                for name in ["text", "source", "page_number", "canonical_id"]
+            ]
+        )
+    )
+    mock_collection.iterator = Mock(
+        return_value=_iterate([make_legacy_object(1), make_legacy_object(3)])
+    )
+    page_collection = Mock()
+    page_collection.config.get = AsyncMock(
+        return_value=SimpleNamespace(properties=[])
+    )
+    page_collection.config.add_property = AsyncMock()
+    page_collection.iterator = Mock(return_value=_iterate([]))
+    page_collection.data.insert_many = AsyncMock(
+        return_value=SimpleNamespace(errors={})
+    )
+    client = Mock()
+    client.collections.exists = AsyncMock(return_value=True)
+    client.collections.get = Mock(
+        side_effect=lambda name: {"Chunk": mock_collection, "Page": page_collection}[
+            name
+        ]
+    )
+    repo = WeaviateRepository(client=client)
+
+    # Execute
+    report = await BackfillPageIndexUseCase(repo=repo).execute()
+
+    # Verify the property was added and the chunks rewritten with it
+    added = mock_collection.config.add_property.call_args[0][0]
+    assert added.name == "page_key"
+    key = _page_key("old.pdf", 1)
+    objects = mock_collection.data.insert_many.call_args[0][0]
+    assert [obj.properties["page_key"] for obj in objects] == [key, key]
+    assert [obj.vector for obj in objects] == [[1.0, 1.0], [3.0, 1.0]]
+
+    # Verify one Page object, pooled from both chunks
+    (page,) = page_collection.data.insert_many.call_args[0][0]
+    assert page.uuid == key
+    assert page.properties["chunk_count"] == 2
+    assert page.vector == [2.0, 1.0]
+    assert report.pages_written == 1
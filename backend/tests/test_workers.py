@@ -0,0 +1,20 @@
+from src import workers
+
+
+def test_worker_path_gives_each_worker_its_own_file(tmp_path, monkeypatch):
+    monkeypatch.setattr(workers, "_slot_locks", [])
+    path = str(tmp_path / "dedup.jsonl")
+
+    # Each call stands in for a worker claiming a slot
+    first = workers.worker_path(path, workers=2)
+    second = workers.worker_path(path, workers=2)
+    third = workers.worker_path(path, workers=2)
+
+    assert first == f"{path}.0"
+    assert second == f"{path}.1"
+    assert third.startswith(f"{path}.pid")
+    assert workers.worker_path(path, workers=1) == path
+    assert workers.worker_path(None, workers=2) is None
+
+    for lock in workers._slot_locks:
+        lock.close()